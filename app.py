@@ -6,8 +6,11 @@ Flask 메인 애플리케이션
 
 from flask import Flask
 from config import config
-from utils.db import create_connection_pool
+from utils.db import create_connection_pool, close_db
 from utils.logging_setup import setup_logging
+from utils.json_provider import FastJSONProvider
+from utils.auth import warm_admin_cache
+from utils.datetime_parser import format_datetime_korean
 import utils.db as db_module
 import os
 
@@ -32,17 +35,29 @@ def create_app(config_name=None):
     app.config.from_object(config[config_name])
     config[config_name].init_app(app)
     
+    # JSON 직렬화: orjson (없으면 ujson → Flask 기본)
+    app.json = FastJSONProvider(app)
+    
+    # 템플릿 필터: {{ dt | korean_dt }}
+    app.add_template_filter(format_datetime_korean, 'korean_dt')
+    
     # 로깅 설정
     setup_logging(app)
     
     # Connection Pool 초기화
     try:
-        db_module.connection_pool = create_connection_pool()
+        db_module.connection_pool = create_connection_pool(
+            pool_size=app.config['DB_POOL_SIZE'],
+            connection_timeout=app.config['DB_CONN_TIMEOUT']
+        )
         app.logger.info("✅ MySQL Connection Pool initialized")
     except Exception as e:
         app.logger.error(f"❌ Failed to initialize Connection Pool: {e}")
         raise
     
+    # 요청 종료 시 DB 연결 반납
+    app.teardown_appcontext(close_db)
+    
     # 라우트 등록
     from routes import user_routes, admin_routes, web_routes
     
@@ -52,6 +67,12 @@ def create_app(config_name=None):
     
     app.logger.info("✅ All routes registered")
     
+    # 관리자 캐시 예열 (실패해도 첫 관리자 요청에서 다시 로드)
+    try:
+        warm_admin_cache()
+    except Exception as e:
+        app.logger.warning(f"⚠️ 관리자 캐시 예열 실패: {e}")
+    
     # 헬스 체크 엔드포인트
     @app.route('/health')
     def health_check():
@@ -85,5 +106,5 @@ app = create_app()
 
 if __name__ == '__main__':
     # 로컬 개발 서버 실행 (개발 전용)
-    # 프로덕션에서는 WSGI 서버 사용
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    # 프로덕션에서는 Gunicorn 사용: gunicorn -c gunicorn.conf.py app:app
+    app.run(host='0.0.0.0', port=5000, debug=app.config['DEBUG'])
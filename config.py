@@ -6,6 +6,24 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+def _default_pool_size(max_connections):
+    """
+    워커 프로세스당 Connection Pool 기본 크기
+    
+    Args:
+        max_connections (int): 모든 워커가 나눠 쓸 MySQL 연결 수
+    
+    Returns:
+        int: gthread는 워커의 동시 처리 스레드 수 (GUNICORN_THREADS, 기본 4),
+             gevent는 워커 하나가 많은 요청을 동시에 처리하므로
+             max_connections를 워커 수(기본 코어 수)로 나눈 값
+    """
+    if os.environ.get('GUNICORN_WORKER_CLASS') == 'gevent':
+        workers = int(os.environ.get('GUNICORN_WORKERS', os.cpu_count() or 1))
+        return max(max_connections // workers, 1)
+    return int(os.environ.get('GUNICORN_THREADS', 4))
+
+
 class Config:
     """기본 설정 클래스"""
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key'
@@ -14,6 +32,29 @@ class Config:
     DB_USER = os.environ.get('DB_USER', 'root')
     DB_PASSWORD = os.environ.get('DB_PASSWORD', '')
     DB_NAME = os.environ.get('DB_NAME', 'scheduledb')
+    
+    # MySQL max_connections(기본 151) 중 이 앱의 모든 워커가 나눠 쓸 연결 수 (여유분 제외)
+    DB_MAX_CONNECTIONS = int(os.environ.get('DB_MAX_CONNECTIONS', 140))
+    
+    # Connection Pool 크기 (워커 프로세스당): 기본값은 _default_pool_size() 참고
+    # 풀은 시작 시 연결을 모두 열어두므로 workers × DB_POOL_SIZE개가 부팅 직후 바로 사용됨
+    # workers × DB_POOL_SIZE ≤ DB_MAX_CONNECTIONS (gunicorn.conf.py에서 시작 시 검사)
+    # mysql-connector 풀 최대 크기(32)를 넘지 않도록 제한
+    DB_POOL_SIZE = min(
+        int(os.environ.get('DB_POOL_SIZE', _default_pool_size(DB_MAX_CONNECTIONS))),
+        32
+    )
+    DB_CONN_TIMEOUT = int(os.environ.get('DB_CONN_TIMEOUT', 5))  # 연결 타임아웃(초)
+    
+    # [배포 전제 조건] MySQL 서버 스레드 풀
+    # 모든 API가 짧은 쿼리 1~3개만 실행하므로 (OLTP 패턴)
+    # 신청 마감 직전 동시 요청이 몰릴 때 thread-per-connection 방식보다 유리합니다.
+    # 앱 코드 변경 없이 MySQL 서버(my.cnf 또는 클라우드 콘솔)에서 설정:
+    #   thread_handling = pool-of-threads
+    #   thread_pool_size = <vCPU 수>
+    #   thread_pool_oversubscribe = 3
+    #   thread_pool_stall_limit = 10
+    # 클라이언트 Connection Pool(DB_POOL_SIZE)을 대체하지 않고 함께 사용합니다.
     FLASK_ENV = os.environ.get('FLASK_ENV', 'production')
     DEBUG = (FLASK_ENV == 'development')
     
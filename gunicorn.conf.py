@@ -0,0 +1,67 @@
+"""
+Gunicorn 설정
+
+프로덕션에서는 Flask 개발 서버(app.run) 대신 Gunicorn으로 실행합니다.
+
+실행 방법:
+  gunicorn -c gunicorn.conf.py app:app
+
+Note:
+    - 워커 수 기본값: (CPU 코어 수 × 2) + 1
+    - 워커 타입 기본값: gthread (DB 대기 위주의 I/O 작업에 적합)
+    - 워커당 스레드 수는 DB_POOL_SIZE를 넘지 않음 (config.Config에서 읽음)
+    - GUNICORN_WORKER_CLASS=gevent: MySQL 대기 중 다른 요청 처리 (코어당 1 워커)
+      gevent 워커는 시작 시 monkey.patch_all()을 자동 적용하며,
+      소켓 I/O가 양보되도록 MySQL 드라이버를 순수 파이썬 모드로 전환합니다.
+      워커당 DB를 동시에 쓰는 요청 수는 DB_POOL_SIZE로 제한됩니다
+      (기본값: DB_MAX_CONNECTIONS ÷ 워커 수, 최대 32).
+      이를 넘는 요청은 연결을 약 0.2초 기다린 뒤 실패하므로,
+      더 많은 동시 요청이 필요하면 MySQL max_connections와 DB_MAX_CONNECTIONS를 함께 늘립니다.
+    - 시작 시 workers × DB_POOL_SIZE가 DB_MAX_CONNECTIONS를 넘으면 실행 중단
+      (GUNICORN_CMD_ARGS의 --workers는 검사에 반영되지 않으므로 GUNICORN_WORKERS 사용)
+    - GUNICORN_CMD_ARGS 환경 변수로 재빌드 없이 값 조정 가능
+      예) GUNICORN_CMD_ARGS="--workers 3 --threads 8"
+"""
+
+import multiprocessing
+import os
+
+from config import Config
+
+# 바인딩 주소 (Nginx 연동 시: unix:/run/gunicorn.sock)
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:5000')
+
+# 워커 설정
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread')
+# 워커당 동시 처리 스레드 수 (기본값: DB_POOL_SIZE)
+# 연결 풀보다 스레드가 많으면 풀 대기/PoolError가 발생하므로 DB_POOL_SIZE로 제한
+threads = min(
+    int(os.environ.get('GUNICORN_THREADS', Config.DB_POOL_SIZE)),
+    Config.DB_POOL_SIZE
+)
+
+if worker_class == 'gevent':
+    # 워커 하나가 수백 개의 요청을 번갈아 처리하므로 코어당 1개면 충분
+    workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count()))
+    worker_connections = int(os.environ.get('GUNICORN_WORKER_CONNECTIONS', 1000))
+    # C 확장 드라이버는 gevent에 양보하지 않으므로 순수 파이썬 드라이버 사용
+    os.environ.setdefault('DB_USE_PURE', 'true')
+else:
+    workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+
+# 풀은 시작 시 연결을 모두 열어두므로 전체 연결 수가 MySQL 허용치를 넘으면
+# 워커들이 "Too many connections"로 실패함 → 미리 중단하고 원인을 알림
+if workers * Config.DB_POOL_SIZE > Config.DB_MAX_CONNECTIONS:
+    raise RuntimeError(
+        f"workers({workers}) × DB_POOL_SIZE({Config.DB_POOL_SIZE}) exceeds "
+        f"DB_MAX_CONNECTIONS({Config.DB_MAX_CONNECTIONS}); "
+        f"lower GUNICORN_WORKERS/DB_POOL_SIZE or raise MySQL max_connections"
+    )
+
+# 워커 heartbeat 파일을 메모리 파일시스템에 저장 (디스크 I/O 블로킹 방지)
+if os.path.isdir('/dev/shm'):
+    worker_tmp_dir = '/dev/shm'
+
+# 타임아웃 설정
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 30))
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', 5))
@@ -1,7 +1,7 @@
 """
 관리자 라우트 (디버깅 로깅 추가)
 
-관리자 전용 API 엔드포인트
+관리자 전용 API 엔드포인트 (권한 확인은 before_request에서 공통 처리)
 - /admin/register: 스케줄 등록
 - /admin/modify: 스케줄 수정 (통합)
 - /admin/delete: 스케줄 삭제
@@ -10,22 +10,64 @@
 """
 
 from flask import Blueprint, request, current_app
-from utils.db import get_db_connection
-from utils.kakao_response import simple_text
+from utils.db import get_db, get_cursor
+from utils.auth import is_admin, is_super_admin, cache_admin_added, cache_admin_removed
+from utils.kakao_request import (
+    extract_params, extract_user_id, extract_utterance,
+    SCHEDULE_PARAMS, SCHEDULE_KEY_PARAMS
+)
+from utils.kakao_response import simple_text, handle_errors
+from utils.logging_setup import log_admin_action
+from utils.cache import invalidate_status_cache
 from utils.datetime_parser import (
-    parse_admin_schedule, 
-    parse_user_input,
+    parse_admin_schedule_cached,
+    parse_user_input_cached,
     format_datetime_short, 
     format_datetime_korean,
     format_duration,
-    extract_number
+    extract_number,
+    extract_numbers,
+    resolve_schedule_datetime
 )
-from datetime import datetime
+from datetime import timedelta
 
 bp = Blueprint('admin', __name__)
 
+# 슈퍼 관리자 전용 엔드포인트
+SUPER_ADMIN_ENDPOINTS = {'admin.add_admin', 'admin.remove_admin'}
+
+
+@bp.before_request
+def require_admin():
+    """
+    관리자 권한 확인 (모든 관리자 라우트 공통)
+    
+    권한이 없으면 핸들러를 실행하지 않고 바로 응답합니다.
+    - /admin/add_admin, /admin/remove_admin: 슈퍼 관리자만 허용
+    - 그 외: 관리자(일반 + 슈퍼) 허용
+    
+    Note:
+        request.get_json()은 파싱 결과를 캐시하므로
+        핸들러의 get_json()은 다시 파싱하지 않습니다.
+    """
+    try:
+        user_id = extract_user_id(request.get_json(silent=True) or {})
+        
+        if request.endpoint in SUPER_ADMIN_ENDPOINTS:
+            if not user_id or not is_super_admin(user_id):
+                current_app.logger.warning("슈퍼 관리자 아님: %s", user_id)
+                return simple_text("❌ 슈퍼 관리자 권한이 필요합니다.")
+        elif not user_id or not is_admin(user_id):
+            current_app.logger.warning("권한 거부: %s", user_id)
+            return simple_text("❌ 관리자 권한이 없습니다.")
+    
+    except Exception as e:
+        current_app.logger.error("❌ 관리자 권한 확인 실패: %s", e, exc_info=True)
+        return simple_text("❌ 서버 에러가 발생했습니다. 잠시 후 다시 시도해주세요.")
+
 
 @bp.route('/admin/register', methods=['POST'])
+@handle_errors('스케줄 등록')
 def register_schedule():
     """
     관리자 스케줄 등록 API
@@ -39,117 +81,96 @@ def register_schedule():
     
     예시 발화: "27일 월요일 11시 4시간 5명"
     """
-    conn = None
-    cursor = None
+    log = current_app.logger
     
-    try:
-        data = request.json
-        user_id = data['userRequest']['user']['id']
-        
-        params = data['action']['params']
-        day = params.get('date_day')
-        week_day = params.get('week_day')
-        hour = params.get('time_hour')
-        duration = params.get('duration_hour')
-        capacity = params.get('capacity_count')
-        
-        # 로깅
-        current_app.logger.info(
-            f"API Call: /admin/register | User: {user_id} | "
-            f"Params: day={day}, week={week_day}, hour={hour}, duration={duration}, capacity={capacity}"
+    data = request.get_json(silent=True) or {}
+    user_id, (day, week_day, hour, duration, capacity) = extract_params(
+        data, SCHEDULE_PARAMS
+    )
+    
+    # 로깅
+    log.info(
+        "API Call: /admin/register | User: %s | "
+        "Params: day=%s, week=%s, hour=%s, duration=%s, capacity=%s",
+        user_id, day, week_day, hour, duration, capacity
+    )
+    
+    # 필수 파라미터 체크
+    if not (day and week_day and hour and duration and capacity):
+        log.warning("파라미터 누락 | User: %s", user_id)
+        return simple_text(
+            "필수 정보가 누락되었습니다.\n"
+            "예) 27일 월요일 11시 4시간 5명"
         )
+    
+    # 스케줄 파싱 (ValueError는 handle_errors에서 처리)
+    schedule_info = parse_admin_schedule_cached(
+        day=day, 
+        hour=hour, 
+        minute='0',
+        duration=duration, 
+        capacity=capacity
+    )
+    log.info("스케줄 파싱 성공: %s", schedule_info)
+    
+    # DB 연결 (입력 검증 후)
+    conn = get_db()
+    cursor = get_cursor()
+    
+    # 스케줄 등록 (중복은 uq_schedule로 무시되어 rowcount = 0)
+    # SELECT 후 INSERT 하던 2회 왕복을 1회로 줄이고 동시 등록 경쟁도 제거
+    cursor.execute("""
+        INSERT IGNORE INTO schedules 
+        (schedule_datetime, duration_minutes, capacity, current_count)
+        VALUES (%s, %s, %s, 0)
+    """, (
+        schedule_info['schedule_datetime'],
+        schedule_info['duration_minutes'],
+        schedule_info['capacity']
+    ))
+    
+    if cursor.rowcount == 0:
+        log.warning("중복 스케줄: %s", schedule_info['schedule_datetime'])
         
-        # 필수 파라미터 체크
-        if not all([day, week_day, hour, duration, capacity]):
-            current_app.logger.warning(f"파라미터 누락 | User: {user_id}")
-            return simple_text(
-                "필수 정보가 누락되었습니다.\n"
-                "예) 27일 월요일 11시 4시간 5명"
-            )
-        
-        # DB 연결
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-        
-        # 관리자 권한 확인
-        cursor.execute("SELECT * FROM admins WHERE user_id = %s", (user_id,))
-        admin = cursor.fetchone()
-        
-        current_app.logger.info(f"관리자 조회: user_id={user_id}, is_admin={admin is not None}")
-        
-        if not admin:
-            current_app.logger.warning(f"권한 거부: {user_id}")
-            return simple_text("❌ 관리자 권한이 없습니다.")
-        
-        # 스케줄 파싱
-        try:
-            schedule_info = parse_admin_schedule(
-                day=day, 
-                hour=hour, 
-                minute='0',
-                duration=duration, 
-                capacity=capacity
-            )
-            current_app.logger.info(f"스케줄 파싱 성공: {schedule_info}")
-        except ValueError as e:
-            current_app.logger.warning(f"파싱 실패: {str(e)}")
-            return simple_text(f"❌ 입력 형식이 올바르지 않습니다.\n{str(e)}")
-        
-        # 중복 체크
-        cursor.execute("""
-            SELECT id FROM schedules 
-            WHERE schedule_datetime = %s 
-              AND duration_minutes = %s
-        """, (schedule_info['schedule_datetime'], schedule_info['duration_minutes']))
-        
-        if cursor.fetchone():
-            current_app.logger.warning(f"중복 스케줄: {schedule_info['schedule_datetime']}")
-            return simple_text(
-                "⚠️ 이미 해당 시간에 동일한 스케줄이 존재합니다.\n\n"
-                f"📅 {format_datetime_korean(schedule_info['schedule_datetime'])}\n"
-                f"⏰ 근무시간: {format_duration(schedule_info['duration_minutes'])}"
-            )
-        
-        # 스케줄 등록
+        # 충돌 시에만 기존 스케줄 조회 (uq_schedule은 시각만 비교하므로
+        # 근무시간/정원이 다른 스케줄일 수 있어 저장된 값을 보여줌)
         cursor.execute("""
-            INSERT INTO schedules 
-            (schedule_datetime, duration_minutes, capacity, current_count)
-            VALUES (%s, %s, %s, 0)
-        """, (
-            schedule_info['schedule_datetime'],
-            schedule_info['duration_minutes'],
-            schedule_info['capacity']
-        ))
+            SELECT duration_minutes, capacity
+            FROM schedules
+            WHERE schedule_datetime = %s
+        """, (schedule_info['schedule_datetime'],))
+        existing = cursor.fetchone()
         
-        conn.commit()
-        
-        current_app.logger.info(
-            f"✅ 스케줄 등록 완료 | User: {user_id} | DateTime: {schedule_info['schedule_datetime']}"
-        )
+        if existing is None:
+            # 조회 직전에 삭제된 경우
+            return simple_text("❌ 스케줄 등록에 실패했습니다. 다시 시도해주세요.")
         
+        existing_duration, existing_capacity = existing
         return simple_text(
-            f"✅ 스케줄이 등록되었습니다!\n\n"
+            "⚠️ 이미 해당 시간에 스케줄이 존재합니다.\n\n"
             f"📅 {format_datetime_korean(schedule_info['schedule_datetime'])}\n"
-            f"⏰ 근무시간: {format_duration(schedule_info['duration_minutes'])}\n"
-            f"👥 정원: {schedule_info['capacity']}명"
+            f"⏰ 근무시간: {format_duration(existing_duration)}\n"
+            f"👥 정원: {existing_capacity}명"
         )
     
-    except ValueError as e:
-        current_app.logger.warning(f"파라미터 파싱 에러: {str(e)}")
-        return simple_text(f"❌ 입력 형식이 올바르지 않습니다.\n{str(e)}")
+    conn.commit()
+    invalidate_status_cache()
     
-    except Exception as e:
-        current_app.logger.error(f"❌ 스케줄 등록 실패: {str(e)}", exc_info=True)
-        return simple_text("❌ 스케줄 등록에 실패했습니다.")
-    
-    finally:
-        if cursor:
-            cursor.close()
-        if conn:
-            conn.close()
+    log_admin_action(
+        "REGISTER_SCHEDULE", user_id,
+        {"schedule_datetime": str(schedule_info['schedule_datetime'])}
+    )
+    
+    return simple_text(
+        f"✅ 스케줄이 등록되었습니다!\n\n"
+        f"📅 {format_datetime_korean(schedule_info['schedule_datetime'])}\n"
+        f"⏰ 근무시간: {format_duration(schedule_info['duration_minutes'])}\n"
+        f"👥 정원: {schedule_info['capacity']}명"
+    )
 
 
 @bp.route('/admin/modify', methods=['POST'])
+@handle_errors('스케줄 수정')
 def modify_schedule():
     """
     스케줄 수정 API (통합)
@@ -163,124 +184,97 @@ def modify_schedule():
     
     예시 발화: "3일 월요일 11시 8시간 5명 변경"
     """
-    conn = None
-    cursor = None
+    log = current_app.logger
     
-    try:
-        data = request.json
-        user_id = data['userRequest']['user']['id']
-        
-        params = data['action']['params']
-        day = params.get('date_day')
-        week_day = params.get('week_day')
-        hour = params.get('time_hour')
-        duration = params.get('duration_hour')
-        capacity = params.get('capacity_count')
-        
-        current_app.logger.info(
-            f"API Call: /admin/modify | User: {user_id} | "
-            f"Params: day={day}, week={week_day}, hour={hour}, duration={duration}, capacity={capacity}"
+    data = request.get_json(silent=True) or {}
+    user_id, (day, week_day, hour, duration, capacity) = extract_params(
+        data, SCHEDULE_PARAMS
+    )
+    
+    log.info(
+        "API Call: /admin/modify | User: %s | "
+        "Params: day=%s, week=%s, hour=%s, duration=%s, capacity=%s",
+        user_id, day, week_day, hour, duration, capacity
+    )
+    
+    if not (day and week_day and hour and duration and capacity):
+        log.warning("파라미터 누락 | User: %s", user_id)
+        return simple_text(
+            "필수 정보가 누락되었습니다.\n"
+            "예) 3일 월요일 11시 8시간 5명 변경"
+        )
+    
+    # 숫자 추출 (한 번에)
+    day_num, hour_num, duration_num, capacity_num = extract_numbers(
+        day, hour, duration, capacity
+    )
+    
+    # 날짜 계산 (지난 날짜면 다음 달)
+    search_date = resolve_schedule_datetime(day_num, hour_num)
+    search_end = search_date + timedelta(hours=1)
+    
+    conn = get_db()
+    cursor = get_cursor(dictionary=True)
+    
+    # 수정 대상 1건 잠금 조회
+    # 같은 1시간 범위에 스케줄이 여러 개여도 검증/수정/응답이 모두 같은 행을 가리킴
+    cursor.execute("""
+        SELECT id, schedule_datetime, current_count
+        FROM schedules
+        WHERE schedule_datetime >= %s
+          AND schedule_datetime < %s
+        ORDER BY schedule_datetime
+        LIMIT 1
+        FOR UPDATE
+    """, (search_date, search_end))
+    
+    schedule = cursor.fetchone()
+    
+    if not schedule:
+        log.warning("스케줄 없음: %s", search_date)
+        return simple_text(
+            f"❌ 해당 스케줄을 찾을 수 없습니다.\n\n"
+            f"📅 {day_num}일 ({week_day}) {hour_num}시"
+        )
+    
+    # 정원 체크 (행이 잠겨 있으므로 current_count는 커밋 전까지 그대로)
+    # 값이 같으면 UPDATE rowcount가 0이므로 거부 여부는 rowcount로 판단하지 않음
+    # 커밋하지 않은 트랜잭션은 close_db()가 롤백하며 잠금 해제
+    if capacity_num < schedule['current_count']:
+        log.warning(
+            "정원 초과: current=%s, new=%s", schedule['current_count'], capacity_num
         )
-        
-        if not all([day, week_day, hour, duration, capacity]):
-            current_app.logger.warning(f"파라미터 누락 | User: {user_id}")
-            return simple_text(
-                "필수 정보가 누락되었습니다.\n"
-                "예) 3일 월요일 11시 8시간 5명 변경"
-            )
-        
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-        
-        # 관리자 권한 확인
-        cursor.execute("SELECT * FROM admins WHERE user_id = %s", (user_id,))
-        if not cursor.fetchone():
-            current_app.logger.warning(f"권한 거부: {user_id}")
-            return simple_text("❌ 관리자 권한이 없습니다.")
-        
-        # 숫자 추출
-        day_num = extract_number(day)
-        hour_num = extract_number(hour)
-        duration_num = extract_number(duration)
-        capacity_num = extract_number(capacity)
-        
-        # 날짜 계산
-        today = datetime.now()
-        if today.day <= day_num:
-            search_date = datetime(today.year, today.month, day_num, hour_num, 0, 0)
-        else:
-            if today.month == 12:
-                search_date = datetime(today.year + 1, 1, day_num, hour_num, 0, 0)
-            else:
-                search_date = datetime(today.year, today.month + 1, day_num, hour_num, 0, 0)
-        
-        # 기존 스케줄 검색
-        cursor.execute("""
-            SELECT * FROM schedules 
-            WHERE DATE(schedule_datetime) = DATE(%s)
-              AND HOUR(schedule_datetime) = %s
-            LIMIT 1
-        """, (search_date, hour_num))
-        
-        schedule = cursor.fetchone()
-        
-        if not schedule:
-            current_app.logger.warning(f"스케줄 없음: {search_date}")
-            return simple_text(
-                f"❌ 해당 스케줄을 찾을 수 없습니다.\n\n"
-                f"📅 {day_num}일 ({week_day}) {hour_num}시"
-            )
-        
-        # 정원 체크
-        if capacity_num < schedule['current_count']:
-            current_app.logger.warning(
-                f"정원 초과: current={schedule['current_count']}, new={capacity_num}"
-            )
-            return simple_text(
-                f"❌ 현재 신청자({schedule['current_count']}명)보다\n"
-                f"작은 정원({capacity_num}명)으로 변경할 수 없습니다."
-            )
-        
-        # 업데이트
-        cursor.execute("""
-            UPDATE schedules 
-            SET duration_minutes = %s,
-                capacity = %s
-            WHERE id = %s
-        """, (duration_num * 60, capacity_num, schedule['id']))
-        
-        conn.commit()
-        
-        # 업데이트된 정보 조회
-        cursor.execute("SELECT * FROM schedules WHERE id = %s", (schedule['id'],))
-        updated = cursor.fetchone()
-        
-        current_app.logger.info(f"✅ 스케줄 수정 완료 | ID: {schedule['id']}")
-        
         return simple_text(
-            f"✅ 스케줄이 수정되었습니다!\n\n"
-            f"📅 {format_datetime_korean(updated['schedule_datetime'])}\n"
-            f"⏰ 근무시간: {format_duration(updated['duration_minutes'])}\n"
-            f"👥 정원: {updated['capacity']}명\n"
-            f"현재 신청자: {updated['current_count']}명"
+            f"❌ 현재 신청자({schedule['current_count']}명)보다\n"
+            f"작은 정원({capacity_num}명)으로 변경할 수 없습니다."
         )
     
-    except ValueError as e:
-        current_app.logger.warning(f"파라미터 파싱 에러: {str(e)}")
-        return simple_text(f"❌ 입력 형식이 올바르지 않습니다.\n{str(e)}")
+    cursor.execute("""
+        UPDATE schedules 
+        SET duration_minutes = %s,
+            capacity = %s
+        WHERE id = %s
+    """, (duration_num * 60, capacity_num, schedule['id']))
     
-    except Exception as e:
-        current_app.logger.error(f"❌ 스케줄 수정 실패: {str(e)}", exc_info=True)
-        return simple_text("❌ 스케줄 수정에 실패했습니다.")
-    
-    finally:
-        if cursor:
-            cursor.close()
-        if conn:
-            conn.close()
+    conn.commit()
+    invalidate_status_cache()
+    
+    log_admin_action(
+        "MODIFY_SCHEDULE", user_id,
+        {"schedule_id": schedule['id']}
+    )
+    
+    return simple_text(
+        f"✅ 스케줄이 수정되었습니다!\n\n"
+        f"📅 {format_datetime_korean(schedule['schedule_datetime'])}\n"
+        f"⏰ 근무시간: {format_duration(duration_num * 60)}\n"
+        f"👥 정원: {capacity_num}명\n"
+        f"현재 신청자: {schedule['current_count']}명"
+    )
 
 
 @bp.route('/admin/delete', methods=['POST'])
+@handle_errors('스케줄 삭제')
 def delete_schedule():
     """
     스케줄 삭제 API
@@ -293,90 +287,70 @@ def delete_schedule():
     
     예시 발화: "27일 월요일 11시 4시간 삭제"
     """
-    conn = None
-    cursor = None
+    log = current_app.logger
     
-    try:
-        data = request.json
-        user_id = data['userRequest']['user']['id']
-        
-        params = data['action']['params']
-        day = params.get('date_day')
-        week_day = params.get('week_day')
-        hour = params.get('time_hour')
-        duration = params.get('duration_hour')
-        
-        current_app.logger.info(
-            f"API Call: /admin/delete | User: {user_id} | "
-            f"Params: day={day}, week={week_day}, hour={hour}, duration={duration}"
-        )
-        
-        if not all([day, week_day, hour, duration]):
-            current_app.logger.warning(f"파라미터 누락 | User: {user_id}")
-            return simple_text(
-                "필수 정보가 누락되었습니다.\n"
-                "예) 27일 월요일 11시 4시간 삭제"
-            )
-        
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-        
-        # 관리자 권한 확인
-        cursor.execute("SELECT * FROM admins WHERE user_id = %s", (user_id,))
-        if not cursor.fetchone():
-            current_app.logger.warning(f"권한 거부: {user_id}")
-            return simple_text("❌ 관리자 권한이 없습니다.")
-        
-        # 스케줄 검색
-        try:
-            parsed = parse_user_input(day, hour, minute='0', duration=duration)
-            target_datetime = parsed['schedule_datetime']
-            duration_minutes = parsed['duration_minutes']
-        except ValueError as e:
-            current_app.logger.warning(f"파싱 실패: {str(e)}")
-            return simple_text(f"❌ 입력 형식이 올바르지 않습니다.\n{str(e)}")
-        
-        cursor.execute("""
-            SELECT * FROM schedules 
-            WHERE schedule_datetime = %s 
-              AND duration_minutes = %s
-        """, (target_datetime, duration_minutes))
-        
-        schedule = cursor.fetchone()
-        
-        if not schedule:
-            current_app.logger.warning(f"스케줄 없음: {target_datetime}")
-            return simple_text(f"❌ 해당 스케줄을 찾을 수 없습니다.")
-        
-        # 관련 신청 삭제
-        cursor.execute("DELETE FROM applications WHERE schedule_id = %s", (schedule['id'],))
-        
-        # 스케줄 삭제
-        cursor.execute("DELETE FROM schedules WHERE id = %s", (schedule['id'],))
-        
-        conn.commit()
-        
-        current_app.logger.info(f"✅ 스케줄 삭제 완료 | ID: {schedule['id']}")
-        
+    data = request.get_json(silent=True) or {}
+    user_id, (day, week_day, hour, duration) = extract_params(
+        data, SCHEDULE_KEY_PARAMS
+    )
+    
+    log.info(
+        "API Call: /admin/delete | User: %s | "
+        "Params: day=%s, week=%s, hour=%s, duration=%s",
+        user_id, day, week_day, hour, duration
+    )
+    
+    if not (day and week_day and hour and duration):
+        log.warning("파라미터 누락 | User: %s", user_id)
         return simple_text(
-            f"✅ 스케줄이 삭제되었습니다.\n\n"
-            f"📅 {format_datetime_short(schedule['schedule_datetime'])}\n"
-            f"⏰ 근무시간: {format_duration(schedule['duration_minutes'])}\n"
-            f"(신청자 {schedule['current_count']}명 함께 삭제됨)"
+            "필수 정보가 누락되었습니다.\n"
+            "예) 27일 월요일 11시 4시간 삭제"
         )
     
-    except Exception as e:
-        current_app.logger.error(f"❌ 스케줄 삭제 실패: {str(e)}", exc_info=True)
-        return simple_text("❌ 스케줄 삭제에 실패했습니다.")
-    
-    finally:
-        if cursor:
-            cursor.close()
-        if conn:
-            conn.close()
+    # 날짜 파싱 (1시간 범위)
+    start_dt, end_dt = parse_user_input_cached(day, hour)
+    duration_minutes = extract_number(duration) * 60
+    
+    conn = get_db()
+    cursor = get_cursor(dictionary=True)
+    
+    # 삭제 대상 조회 + 잠금 (응답 메시지용)
+    cursor.execute("""
+        SELECT id, schedule_datetime, duration_minutes, current_count
+        FROM schedules
+        WHERE schedule_datetime BETWEEN %s AND %s
+          AND duration_minutes = %s
+        LIMIT 1
+        FOR UPDATE
+    """, (start_dt, end_dt, duration_minutes))
+    
+    schedule = cursor.fetchone()
+    
+    if not schedule:
+        log.warning("스케줄 없음: %s", start_dt)
+        return simple_text(f"❌ 해당 스케줄을 찾을 수 없습니다.")
+    
+    # 스케줄 삭제 (관련 신청은 FK ON DELETE CASCADE로 함께 삭제)
+    cursor.execute("DELETE FROM schedules WHERE id = %s", (schedule['id'],))
+    
+    conn.commit()
+    invalidate_status_cache()
+    
+    log_admin_action(
+        "DELETE_SCHEDULE", user_id,
+        {"schedule_id": schedule['id']}
+    )
+    
+    return simple_text(
+        f"✅ 스케줄이 삭제되었습니다.\n\n"
+        f"📅 {format_datetime_short(schedule['schedule_datetime'])}\n"
+        f"⏰ 근무시간: {format_duration(schedule['duration_minutes'])}\n"
+        f"(신청자 {schedule['current_count']}명 함께 삭제됨)"
+    )
 
 
 @bp.route('/admin/add_admin', methods=['POST'])
+@handle_errors('관리자 추가')
 def add_admin():
     """
     관리자 추가 API
@@ -384,79 +358,62 @@ def add_admin():
     발화: "관리자 추가 {user_id} {nickname}"
     예시: "관리자 추가 user123 김철수"
     """
-    conn = None
-    cursor = None
+    log = current_app.logger
     
-    try:
-        data = request.json
-        user_id = data['userRequest']['user']['id']
-        utterance = data['userRequest']['utterance']
-        
-        current_app.logger.info(
-            f"API Call: /admin/add_admin | User: {user_id} | Utterance: {utterance}"
-        )
-        
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-        
-        # 슈퍼 관리자 확인
-        cursor.execute("""
-            SELECT * FROM admins 
-            WHERE user_id = %s AND added_by = 'system'
-        """, (user_id,))
-        
-        if not cursor.fetchone():
-            current_app.logger.warning(f"슈퍼 관리자 아님: {user_id}")
-            return simple_text("❌ 슈퍼 관리자 권한이 필요합니다.")
-        
-        # 발화 파싱
-        parts = utterance.split()
-        if len(parts) < 3:
-            current_app.logger.warning(f"파싱 실패: {utterance}")
-            return simple_text(
-                "입력 형식이 올바르지 않습니다.\n"
-                "예) 관리자 추가 user123 김철수"
-            )
-        
-        new_admin_id = parts[2]
-        new_admin_nickname = parts[3] if len(parts) > 3 else "관리자"
-        
-        # 사용자 등록 또는 업데이트
-        cursor.execute("SELECT * FROM users WHERE user_id = %s", (new_admin_id,))
-        if not cursor.fetchone():
-            cursor.execute(
-                "INSERT INTO users (user_id, nickname) VALUES (%s, %s)",
-                (new_admin_id, new_admin_nickname)
-            )
-        
-        # 관리자 등록
-        cursor.execute("""
-            INSERT INTO admins (user_id, added_by) 
-            VALUES (%s, %s)
-        """, (new_admin_id, user_id))
-        
-        conn.commit()
-        
-        current_app.logger.info(f"✅ 관리자 추가 완료: {new_admin_id}")
-        
+    data = request.get_json(silent=True) or {}
+    user_id, utterance = extract_utterance(data)
+    
+    log.info(
+        "API Call: /admin/add_admin | User: %s | Utterance: %s", user_id, utterance
+    )
+    
+    # 발화 파싱: "관리자 추가 {user_id} {nickname}"
+    # 닉네임은 공백을 포함할 수 있으므로 최대 4개로만 분리
+    parts = (utterance or '').split(None, 3)
+    if len(parts) < 3 or parts[0] != '관리자' or parts[1] != '추가':
+        log.warning("파싱 실패: %s", utterance)
         return simple_text(
-            f"✅ 관리자가 추가되었습니다!\n\n"
-            f"👤 User ID: {new_admin_id}\n"
-            f"📛 닉네임: {new_admin_nickname}"
+            "입력 형식이 올바르지 않습니다.\n"
+            "예) 관리자 추가 user123 김철수"
         )
     
-    except Exception as e:
-        current_app.logger.error(f"❌ 관리자 추가 실패: {str(e)}", exc_info=True)
-        return simple_text("❌ 관리자 추가에 실패했습니다.")
-    
-    finally:
-        if cursor:
-            cursor.close()
-        if conn:
-            conn.close()
+    new_admin_id = parts[2]
+    new_admin_nickname = parts[3] if len(parts) > 3 else "관리자"
+    
+    # 형식 검증 후에만 DB 연결
+    conn = get_db()
+    cursor = get_cursor()
+    
+    # 사용자 등록 (이미 있으면 기존 닉네임 유지)
+    cursor.execute("""
+        INSERT INTO users (user_id, nickname) 
+        VALUES (%s, %s)
+        ON DUPLICATE KEY UPDATE user_id = user_id
+    """, (new_admin_id, new_admin_nickname))
+    
+    # 관리자 등록
+    cursor.execute("""
+        INSERT INTO admins (user_id, added_by) 
+        VALUES (%s, %s)
+    """, (new_admin_id, user_id))
+    
+    conn.commit()
+    cache_admin_added(new_admin_id, user_id)
+    
+    log_admin_action(
+        "ADD_ADMIN", user_id,
+        {"target_admin_id": new_admin_id}
+    )
+    
+    return simple_text(
+        f"✅ 관리자가 추가되었습니다!\n\n"
+        f"👤 User ID: {new_admin_id}\n"
+        f"📛 닉네임: {new_admin_nickname}"
+    )
 
 
 @bp.route('/admin/remove_admin', methods=['POST'])
+@handle_errors('관리자 삭제')
 def remove_admin():
     """
     관리자 삭제 API
@@ -464,69 +421,50 @@ def remove_admin():
     발화: "관리자 삭제 {user_id}"
     예시: "관리자 삭제 user123"
     """
-    conn = None
-    cursor = None
+    log = current_app.logger
     
-    try:
-        data = request.json
-        user_id = data['userRequest']['user']['id']
-        utterance = data['userRequest']['utterance']
-        
-        current_app.logger.info(
-            f"API Call: /admin/remove_admin | User: {user_id} | Utterance: {utterance}"
-        )
-        
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-        
-        # 슈퍼 관리자 확인
-        cursor.execute("""
-            SELECT * FROM admins 
-            WHERE user_id = %s AND added_by = 'system'
-        """, (user_id,))
-        
-        if not cursor.fetchone():
-            current_app.logger.warning(f"슈퍼 관리자 아님: {user_id}")
-            return simple_text("❌ 슈퍼 관리자 권한이 필요합니다.")
-        
-        # 발화 파싱
-        parts = utterance.split()
-        if len(parts) < 3:
-            current_app.logger.warning(f"파싱 실패: {utterance}")
-            return simple_text(
-                "입력 형식이 올바르지 않습니다.\n"
-                "예) 관리자 삭제 user123"
-            )
-        
-        target_admin_id = parts[2]
-        
-        # 본인 삭제 방지
-        if target_admin_id == user_id:
-            current_app.logger.warning(f"본인 삭제 시도: {user_id}")
-            return simple_text("❌ 본인을 삭제할 수 없습니다.")
-        
-        # 관리자 삭제
-        cursor.execute("DELETE FROM admins WHERE user_id = %s", (target_admin_id,))
-        
-        if cursor.rowcount == 0:
-            current_app.logger.warning(f"관리자 아님: {target_admin_id}")
-            return simple_text(f"❌ {target_admin_id}는 관리자가 아닙니다.")
-        
-        conn.commit()
-        
-        current_app.logger.info(f"✅ 관리자 삭제 완료: {target_admin_id}")
-        
+    data = request.get_json(silent=True) or {}
+    user_id, utterance = extract_utterance(data)
+    
+    log.info(
+        "API Call: /admin/remove_admin | User: %s | Utterance: %s", user_id, utterance
+    )
+    
+    # 발화 파싱: "관리자 삭제 {user_id}"
+    parts = (utterance or '').split(None, 3)
+    if len(parts) < 3 or parts[0] != '관리자' or parts[1] != '삭제':
+        log.warning("파싱 실패: %s", utterance)
         return simple_text(
-            f"✅ 관리자가 삭제되었습니다.\n\n"
-            f"👤 User ID: {target_admin_id}"
+            "입력 형식이 올바르지 않습니다.\n"
+            "예) 관리자 삭제 user123"
         )
     
-    except Exception as e:
-        current_app.logger.error(f"❌ 관리자 삭제 실패: {str(e)}", exc_info=True)
-        return simple_text("❌ 관리자 삭제에 실패했습니다.")
-    
-    finally:
-        if cursor:
-            cursor.close()
-        if conn:
-            conn.close()
+    target_admin_id = parts[2]
+    
+    # 본인 삭제 방지
+    if target_admin_id == user_id:
+        log.warning("본인 삭제 시도: %s", user_id)
+        return simple_text("❌ 본인을 삭제할 수 없습니다.")
+    
+    conn = get_db()
+    cursor = get_cursor()
+    
+    # 관리자 삭제
+    cursor.execute("DELETE FROM admins WHERE user_id = %s", (target_admin_id,))
+    
+    if cursor.rowcount == 0:
+        log.warning("관리자 아님: %s", target_admin_id)
+        return simple_text(f"❌ {target_admin_id}는 관리자가 아닙니다.")
+    
+    conn.commit()
+    cache_admin_removed(target_admin_id)
+    
+    log_admin_action(
+        "REMOVE_ADMIN", user_id,
+        {"target_admin_id": target_admin_id}
+    )
+    
+    return simple_text(
+        f"✅ 관리자가 삭제되었습니다.\n\n"
+        f"👤 User ID: {target_admin_id}"
+    )
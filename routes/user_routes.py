@@ -10,15 +10,126 @@
 """
 
 from flask import Blueprint, request, current_app
-from utils.db import get_db_connection
-from utils.kakao_response import simple_text, list_card
-from utils.datetime_parser import parse_user_input, format_datetime_short, format_duration
+from utils.db import get_db, get_cursor
+from utils.kakao_request import (
+    extract_params, extract_user_id, extract_utterance, SCHEDULE_KEY_PARAMS
+)
+from utils.kakao_response import (
+    simple_text, list_card_from_rows, serialize, json_response, handle_errors
+)
+from utils.cache import (
+    get_cached_status, set_cached_status, invalidate_status_cache,
+    get_cached_nickname, cache_nickname
+)
+from utils.datetime_parser import parse_user_input_cached, extract_number, format_datetime_short, format_duration
 from datetime import datetime
 
 bp = Blueprint('user', __name__)
 
+# 기본 명령어 (미등록 사용자가 입력하면 닉네임으로 등록하지 않고 안내)
+GREETING_WORDS = frozenset({'안녕', '시작', '도와줘', '도움말'})
+
+# 사용 방법 안내 (환영 메시지 공통)
+USAGE_GUIDE = (
+    "📅 스케줄 신청 시스템입니다.\n\n"
+    "[사용 방법]\n"
+    "• 신청: 14일 월 14시 8시간\n"
+    "• 취소: 취소\n"
+    "• 현황: 결과\n\n"
+    "원하시는 명령어를 입력해주세요!"
+)
+
+# 고정 응답 (모듈 로드 시 1회 직렬화, json_response()로 반환)
+NICKNAME_PROMPT_BODY = serialize(simple_text(
+    "👋 환영합니다!\n\n"
+    "스케줄 신청 시스템을 사용하시려면\n"
+    "닉네임을 입력해주세요.\n\n"
+    "예) 채희"
+))
+
+NO_APPLICATIONS_BODY = serialize(simple_text(
+    "📋 신청한 스케줄이 없습니다.\n\n"
+    "스케줄을 신청하려면:\n"
+    "예) 14일 월 14시 8시간"
+))
+
+NO_SCHEDULES_BODY = serialize(simple_text(
+    "📅 등록된 스케줄이 없습니다.\n\n"
+    "관리자가 스케줄을 등록할 때까지 기다려주세요."
+))
+
+# /apply 결과 코드 (응답 data.result_code, 동시성 테스트 등 기계 판독용)
+APPLY_RESULT_SUCCESS = 0
+APPLY_RESULT_FULL = 1
+APPLY_RESULT_DUPLICATE = 2
+
+# 내 신청 내역 페이지 크기 (카카오 ListCard 최대 아이템 수)
+APPLICATIONS_PAGE_SIZE = 5
+
+# 내 신청 내역 조회 (페이지 조건/정렬은 호출부에서 추가)
+USER_APPLICATIONS_SQL = """
+    SELECT 
+        a.id AS application_id,
+        s.schedule_datetime,
+        s.duration_minutes,
+        s.capacity,
+        s.current_count
+    FROM applications a
+    JOIN schedules s ON a.schedule_id = s.id
+    WHERE a.user_id = %s 
+      AND s.schedule_datetime >= NOW()
+"""
+
+
+def _application_item(row):
+    """
+    내 신청 내역 ListCard 아이템 생성 (클릭 시 취소 블록으로 이동)
+    
+    Args:
+        row (tuple): USER_APPLICATIONS_SQL 조회 결과 행
+    
+    Returns:
+        dict: ListCard 아이템
+    """
+    application_id, dt, duration_minutes, capacity, current_count = row
+    
+    return {
+        "title": format_datetime_short(dt),
+        "description": (
+            f"⏰ 근무시간: {format_duration(duration_minutes)}\n"
+            f"👥 인원: {current_count}/{capacity}명"
+        ),
+        "action": "block",
+        "blockId": "CANCEL_CONFIRM_BLOCK_ID",  # 실제 ID로 변경 필요
+        "extra": {
+            "application_id": str(application_id)
+        }
+    }
+
+
+def _status_item(row):
+    """
+    현황 ListCard 아이템 생성
+    
+    Args:
+        row (tuple): (schedule_datetime, duration_minutes, capacity, current_count, status)
+    
+    Returns:
+        dict: ListCard 아이템
+    """
+    dt, duration_minutes, capacity, current_count, status = row
+    
+    return {
+        "title": f"{format_datetime_short(dt)} | {status}",
+        "description": (
+            f"⏰ 근무시간: {format_duration(duration_minutes)}\n"
+            f"👥 인원: {current_count}/{capacity}명"
+        )
+    }
+
 
 @bp.route('/welcome', methods=['POST'])
+@handle_errors('환영 메시지', "❌ 서버 에러가 발생했습니다. 잠시 후 다시 시도해주세요.")
 def welcome():
     """
     환영 메시지 API + 닉네임 등록
@@ -30,82 +141,54 @@ def welcome():
     기존 사용자:
     - "안녕" 입력 → 환영 메시지 표시
     """
-    conn = None
-    cursor = None
+    log = current_app.logger
     
-    try:
-        data = request.json
-        user_id = data['userRequest']['user']['id']
-        utterance = data['userRequest']['utterance']
-        
-        current_app.logger.info(f"API Call: /welcome | User: {user_id} | Utterance: {utterance}")
-        
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
+    data = request.get_json(silent=True) or {}
+    user_id, utterance = extract_utterance(data)
+    utterance = (utterance or '').strip()
+    
+    log.info("API Call: /welcome | User: %s | Utterance: %s", user_id, utterance)
+    
+    # 사용자 조회 (캐시에 없을 때만 DB 조회)
+    nickname = get_cached_nickname(user_id)
+    
+    if nickname is None:
+        conn = get_db()
+        cursor = get_cursor()
         
-        # 사용자 조회
-        cursor.execute("SELECT * FROM users WHERE user_id = %s", (user_id,))
+        cursor.execute("SELECT nickname FROM users WHERE user_id = %s", (user_id,))
         user = cursor.fetchone()
         
-        # 첫 방문 (닉네임 없음)
-        if not user:
-            # 기본 명령어인지 확인
-            if utterance.strip() in ['안녕', '시작', '도와줘', '도움말']:
-                return simple_text(
-                    "👋 환영합니다!\n\n"
-                    "스케줄 신청 시스템을 사용하시려면\n"
-                    "닉네임을 입력해주세요.\n\n"
-                    "예) 채희"
-                )
-            else:
-                # 발화를 닉네임으로 등록
-                nickname = utterance.strip()
-                
-                cursor.execute(
-                    "INSERT INTO users (user_id, nickname) VALUES (%s, %s)",
-                    (user_id, nickname)
-                )
-                conn.commit()
-                
-                current_app.logger.info(f"신규 사용자 등록: {user_id} ({nickname})")
-                
-                return simple_text(
-                    f"✅ {nickname}님, 환영합니다!\n\n"
-                    "📅 스케줄 신청 시스템입니다.\n\n"
-                    "[사용 방법]\n"
-                    "• 신청: 14일 월 14시 8시간\n"
-                    "• 취소: 취소\n"
-                    "• 현황: 결과\n\n"
-                    "원하시는 명령어를 입력해주세요!"
-                )
-        
-        # 기존 사용자
-        nickname = user['nickname']
-        
-        message = (
-            f"안녕하세요, {nickname}님! 👋\n\n"
-            "📅 스케줄 신청 시스템입니다.\n\n"
-            "[사용 방법]\n"
-            "• 신청: 14일 월 14시 8시간\n"
-            "• 취소: 취소\n"
-            "• 현황: 결과\n\n"
-            "원하시는 명령어를 입력해주세요!"
-        )
-        
-        return simple_text(message)
+        if user:
+            nickname = user[0]
+            cache_nickname(user_id, nickname)
     
-    except Exception as e:
-        current_app.logger.error(f"Welcome 에러: {str(e)}", exc_info=True)
-        return simple_text("❌ 서버 에러가 발생했습니다. 잠시 후 다시 시도해주세요.")
+    # 첫 방문 (닉네임 없음)
+    if nickname is None:
+        # 기본 명령어인지 확인
+        if utterance in GREETING_WORDS:
+            return json_response(NICKNAME_PROMPT_BODY)
+        else:
+            # 발화를 닉네임으로 등록
+            nickname = utterance
+            
+            cursor.execute(
+                "INSERT INTO users (user_id, nickname) VALUES (%s, %s)",
+                (user_id, nickname)
+            )
+            conn.commit()
+            cache_nickname(user_id, nickname)
+            
+            log.info("신규 사용자 등록: %s (%s)", user_id, nickname)
+            
+            return simple_text(f"✅ {nickname}님, 환영합니다!\n\n{USAGE_GUIDE}")
     
-    finally:
-        if cursor:
-            cursor.close()
-        if conn:
-            conn.close()
+    # 기존 사용자
+    return simple_text(f"안녕하세요, {nickname}님! 👋\n\n{USAGE_GUIDE}")
 
 
 @bp.route('/apply', methods=['POST'])
+@handle_errors('신청 처리')
 def apply_schedule():
     """
     스케줄 신청 API
@@ -118,362 +201,307 @@ def apply_schedule():
     
     예시 발화: "14일 월 14시 8시간 신청"
     """
-    conn = None
-    cursor = None
+    log = current_app.logger
     
-    try:
-        data = request.json
-        user_id = data['userRequest']['user']['id']
-        
-        # 파라미터 추출
-        params = data['action']['params']
-        day = params.get('date_day')
-        week_day = params.get('week_day')
-        hour = params.get('time_hour')
-        duration = params.get('duration_hour')
-        
-        # 로깅
-        current_app.logger.info(
-            f"API Call: /apply | User: {user_id} | "
-            f"Params: day={day}, week={week_day}, hour={hour}, duration={duration}"
+    data = request.get_json(silent=True) or {}
+    # 파라미터 추출
+    user_id, (day, week_day, hour, duration) = extract_params(
+        data, SCHEDULE_KEY_PARAMS
+    )
+    
+    # 로깅
+    log.info(
+        "API Call: /apply | User: %s | "
+        "Params: day=%s, week=%s, hour=%s, duration=%s",
+        user_id, day, week_day, hour, duration
+    )
+    
+    # 필수 파라미터 체크
+    if not (day and week_day and hour and duration):
+        return simple_text(
+            "필수 정보가 누락되었습니다.\n"
+            "예) 14일 월 14시 8시간 신청"
         )
-        
-        # 필수 파라미터 체크
-        if not all([day, week_day, hour, duration]):
-            return simple_text(
-                "필수 정보가 누락되었습니다.\n"
-                "예) 14일 월 14시 8시간 신청"
-            )
-        
-        # 날짜 파싱 (minute=0 고정)
-        parsed = parse_user_input(day, hour, minute='0', duration=duration)
-        target_datetime = parsed['schedule_datetime']
-        duration_minutes = parsed['duration_minutes']
-        
-        # DB 연결
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-        
-        # 사용자 정보 조회
-        cursor.execute("SELECT * FROM users WHERE user_id = %s", (user_id,))
+    
+    # 날짜 파싱 (1시간 범위, minute=0 고정, ValueError는 handle_errors에서 처리)
+    start_dt, end_dt = parse_user_input_cached(day, hour)
+    duration_minutes = extract_number(duration) * 60
+    
+    # DB 연결
+    conn = get_db()
+    cursor = get_cursor()
+    
+    # 사용자 정보 조회 (캐시에 없을 때만 DB 조회)
+    nickname = get_cached_nickname(user_id)
+    
+    if nickname is None:
+        cursor.execute("SELECT nickname FROM users WHERE user_id = %s", (user_id,))
         user = cursor.fetchone()
         
-        if not user:
+        if user:
+            nickname = user[0]
+        else:
             # Welcome 거치지 않은 경우 임시 닉네임
+            nickname = f"유저{user_id[:6]}"
             cursor.execute(
                 "INSERT INTO users (user_id, nickname) VALUES (%s, %s)",
-                (user_id, f"유저{user_id[:6]}")
+                (user_id, nickname)
             )
             conn.commit()
-            
-            cursor.execute("SELECT * FROM users WHERE user_id = %s", (user_id,))
-            user = cursor.fetchone()
-        
-        # 스케줄 검색 (정확한 시간 + 근무시간 매칭)
-        cursor.execute("""
-            SELECT * FROM schedules 
-            WHERE schedule_datetime = %s 
-              AND duration_minutes = %s
-        """, (target_datetime, duration_minutes))
-        
-        schedule = cursor.fetchone()
-        
-        if not schedule:
-            return simple_text(
-                "❌ 존재하지 않는 스케줄입니다.\n\n"
-                f"📅 {format_datetime_short(target_datetime)}\n"
-                f"⏰ 근무시간: {format_duration(duration_minutes)}\n\n"
-                "'결과' 명령어로 현황을 확인해주세요."
-            )
-        
-        # 정원 확인
-        if schedule['current_count'] >= schedule['capacity']:
-            return simple_text(
-                "😢 신청 마감되었습니다.\n\n"
-                f"📅 {format_datetime_short(target_datetime)}\n"
-                f"👥 정원: {schedule['current_count']}/{schedule['capacity']}명"
-            )
-        
-        # 중복 신청 확인
-        cursor.execute("""
-            SELECT * FROM applications 
-            WHERE user_id = %s AND schedule_id = %s
-        """, (user_id, schedule['id']))
-        
-        if cursor.fetchone():
-            return simple_text(
-                "⚠️ 이미 신청한 스케줄입니다.\n\n"
-                f"📅 {format_datetime_short(target_datetime)}"
-            )
-        
-        # 신청 등록
-        cursor.execute("""
-            INSERT INTO applications (user_id, schedule_id)
-            VALUES (%s, %s)
-        """, (user_id, schedule['id']))
-        
-        # 스케줄 인원 업데이트
-        cursor.execute("""
-            UPDATE schedules 
-            SET current_count = current_count + 1 
-            WHERE id = %s
-        """, (schedule['id'],))
-        
-        conn.commit()
-        
-        # 최신 정보 조회
-        cursor.execute("SELECT * FROM schedules WHERE id = %s", (schedule['id'],))
-        updated_schedule = cursor.fetchone()
         
-        current_app.logger.info(
-            f"신청 완료: User={user_id}, Schedule={schedule['id']}, "
-            f"Count={updated_schedule['current_count']}/{updated_schedule['capacity']}"
+        cache_nickname(user_id, nickname)
+    
+    # 스케줄 검색 + 잠금 (조회와 잠금을 한 번에, 트랜잭션 종료까지 유지)
+    cursor.execute("""
+        SELECT id, schedule_datetime, capacity, current_count
+        FROM schedules 
+        WHERE schedule_datetime BETWEEN %s AND %s
+          AND duration_minutes = %s
+        LIMIT 1
+        FOR UPDATE
+    """, (start_dt, end_dt, duration_minutes))
+    
+    schedule = cursor.fetchone()
+    
+    if not schedule:
+        return simple_text(
+            "❌ 존재하지 않는 스케줄입니다.\n\n"
+            f"📅 {format_datetime_short(start_dt)}\n"
+            f"⏰ 근무시간: {format_duration(duration_minutes)}\n\n"
+            "'결과' 명령어로 현황을 확인해주세요."
         )
-        
+    
+    schedule_id, target_datetime, capacity, current_count = schedule
+    
+    # 정원 확인 + 인원 증가 (조건부 업데이트, 정원이 찼으면 rowcount = 0)
+    cursor.execute("""
+        UPDATE schedules 
+        SET current_count = current_count + 1 
+        WHERE id = %s
+          AND current_count < capacity
+    """, (schedule_id,))
+    
+    if cursor.rowcount == 0:
         return simple_text(
-            f"✅ {user['nickname']}님, 신청이 완료되었습니다!\n\n"
+            "😢 신청 마감되었습니다.\n\n"
             f"📅 {format_datetime_short(target_datetime)}\n"
-            f"⏰ 근무시간: {format_duration(duration_minutes)}\n"
-            f"👥 현재 인원: {updated_schedule['current_count']}/{updated_schedule['capacity']}명"
+            f"👥 정원: {current_count}/{capacity}명",
+            data={"result_code": APPLY_RESULT_FULL}
         )
     
-    except ValueError as e:
-        current_app.logger.warning(f"파라미터 파싱 에러: {str(e)}")
-        return simple_text(f"❌ 입력 형식이 올바르지 않습니다.\n{str(e)}")
+    # 신청 등록 (중복은 unique_application으로 무시되어 rowcount = 0)
+    cursor.execute("""
+        INSERT IGNORE INTO applications (user_id, schedule_id)
+        VALUES (%s, %s)
+    """, (user_id, schedule_id))
+    
+    if cursor.rowcount == 0:
+        # 인원 증가 취소
+        conn.rollback()
+        return simple_text(
+            "⚠️ 이미 신청한 스케줄입니다.\n\n"
+            f"📅 {format_datetime_short(target_datetime)}",
+            data={"result_code": APPLY_RESULT_DUPLICATE}
+        )
+    
+    conn.commit()
+    invalidate_status_cache()
+    
+    # 잠금으로 읽은 인원 + 1 = 커밋된 인원 (재조회 불필요)
+    current_count += 1
     
-    except Exception as e:
-        current_app.logger.error(f"신청 처리 실패: {str(e)}", exc_info=True)
-        return simple_text("❌ 신청 처리에 실패했습니다.")
+    log.info(
+        "신청 완료: User=%s, Schedule=%s, Count=%s/%s",
+        user_id, schedule_id, current_count, capacity
+    )
     
-    finally:
-        if cursor:
-            cursor.close()
-        if conn:
-            conn.close()
+    return simple_text(
+        f"✅ {nickname}님, 신청이 완료되었습니다!\n\n"
+        f"📅 {format_datetime_short(target_datetime)}\n"
+        f"⏰ 근무시간: {format_duration(duration_minutes)}\n"
+        f"👥 현재 인원: {current_count}/{capacity}명",
+        data={"result_code": APPLY_RESULT_SUCCESS}
+    )
 
 
 @bp.route('/user/applications', methods=['POST'])
+@handle_errors('신청 내역 조회')
 def get_user_applications():
     """
     내 신청 내역 조회 API
     
     사용자가 "취소" 발화 시 호출
+    
+    페이지네이션 (ListCard 최대 5개):
+    - 다음 페이지 버튼의 extra.after에 마지막 스케줄 시간을 담아 전달
+    - OFFSET 대신 "after 이후" 조건으로 조회하여 페이지가 늘어도 일정한 비용
+      (사용자당 스케줄 1개만 신청 가능 + 스케줄 시간 유일 → 시간만으로 순서 결정)
     """
-    conn = None
-    cursor = None
+    log = current_app.logger
     
-    try:
-        data = request.json
-        user_id = data['userRequest']['user']['id']
-        
-        current_app.logger.info(f"API Call: /user/applications | User: {user_id}")
-        
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-        
-        # 신청 내역 조회
-        cursor.execute("""
-            SELECT 
-                a.id AS application_id,
-                s.schedule_datetime,
-                s.duration_minutes,
-                s.capacity,
-                s.current_count
-            FROM applications a
-            JOIN schedules s ON a.schedule_id = s.id
-            WHERE a.user_id = %s 
-              AND s.schedule_datetime >= NOW()
+    data = request.get_json(silent=True) or {}
+    user_id = extract_user_id(data)
+    
+    # 다음 페이지 기준 시간 (첫 페이지는 None)
+    action = data.get('action') or {}
+    after = (action.get('clientExtra') or {}).get('after')
+    
+    log.info("API Call: /user/applications | User: %s | After: %s", user_id, after)
+    
+    cursor = get_cursor()
+    
+    # 신청 내역 조회 (다음 페이지 존재 확인용으로 1개 더 조회)
+    if after:
+        cursor.execute(USER_APPLICATIONS_SQL + """
+              AND s.schedule_datetime > %s
             ORDER BY s.schedule_datetime
-        """, (user_id,))
-        
-        applications = cursor.fetchall()
-        
-        if not applications:
-            return simple_text(
-                "📋 신청한 스케줄이 없습니다.\n\n"
-                "스케줄을 신청하려면:\n"
-                "예) 14일 월 14시 8시간"
-            )
-        
-        # ListCard 생성
-        items = []
-        for app in applications:
-            dt = app['schedule_datetime']
-            
-            items.append({
-                "title": format_datetime_short(dt),
-                "description": (
-                    f"⏰ 근무시간: {format_duration(app['duration_minutes'])}\n"
-                    f"👥 인원: {app['current_count']}/{app['capacity']}명"
-                ),
-                "action": "block",
-                "blockId": "CANCEL_CONFIRM_BLOCK_ID",  # 실제 ID로 변경 필요
-                "extra": {
-                    "application_id": str(app['application_id'])
-                }
-            })
-        
-        return list_card(
-            title="📋 내 신청 내역",
-            items=items
-        )
+            LIMIT %s
+        """, (user_id, datetime.fromisoformat(after), APPLICATIONS_PAGE_SIZE + 1))
+    else:
+        cursor.execute(USER_APPLICATIONS_SQL + """
+            ORDER BY s.schedule_datetime
+            LIMIT %s
+        """, (user_id, APPLICATIONS_PAGE_SIZE + 1))
+    
+    applications = cursor.fetchall()
+    
+    if not applications:
+        return json_response(NO_APPLICATIONS_BODY)
     
-    except Exception as e:
-        current_app.logger.error(f"신청 내역 조회 실패: {str(e)}", exc_info=True)
-        return simple_text("❌ 신청 내역 조회에 실패했습니다.")
+    has_next = len(applications) > APPLICATIONS_PAGE_SIZE
+    applications = applications[:APPLICATIONS_PAGE_SIZE]
     
-    finally:
-        if cursor:
-            cursor.close()
-        if conn:
-            conn.close()
+    buttons = []
+    if has_next:
+        buttons.append({
+            "action": "block",
+            "label": "다음 페이지 →",
+            "blockId": "CANCEL_LIST_BLOCK_ID",  # 실제 ID로 변경 필요
+            "extra": {
+                "after": applications[-1][1].isoformat()  # schedule_datetime
+            }
+        })
+    
+    # ListCard 생성
+    return list_card_from_rows("📋 내 신청 내역", applications, _application_item, buttons)
 
 
 @bp.route('/cancel', methods=['POST'])
+@handle_errors('신청 취소')
 def cancel_application():
     """
     신청 취소 API
     
     ListCard에서 item 클릭 시 호출
     """
-    conn = None
-    cursor = None
+    log = current_app.logger
     
-    try:
-        data = request.json
-        user_id = data['userRequest']['user']['id']
-        
-        # application_id 추출
-        client_extra = data['action'].get('clientExtra', {})
-        application_id = client_extra.get('application_id')
-        
-        if not application_id:
-            params = data['action'].get('params', {})
-            application_id = params.get('application_id')
-        
-        current_app.logger.info(
-            f"API Call: /cancel | User: {user_id} | App ID: {application_id}"
-        )
-        
-        if not application_id:
-            return simple_text("❌ 취소할 신청을 선택해주세요.")
-        
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-        
-        # 신청 정보 조회
-        cursor.execute("""
-            SELECT a.*, s.schedule_datetime, s.duration_minutes
-            FROM applications a
-            JOIN schedules s ON a.schedule_id = s.id
-            WHERE a.id = %s AND a.user_id = %s
-        """, (application_id, user_id))
-        
-        application = cursor.fetchone()
-        
-        if not application:
-            return simple_text("❌ 취소할 신청을 찾을 수 없습니다.")
-        
-        # 신청 삭제
-        cursor.execute("DELETE FROM applications WHERE id = %s", (application_id,))
-        
-        # 스케줄 인원 감소
-        cursor.execute("""
-            UPDATE schedules 
-            SET current_count = current_count - 1 
-            WHERE id = %s
-        """, (application['schedule_id'],))
-        
-        conn.commit()
-        
-        current_app.logger.info(
-            f"신청 취소 완료: User={user_id}, Schedule={application['schedule_id']}"
-        )
-        
-        return simple_text(
-            f"✅ 신청이 취소되었습니다.\n\n"
-            f"📅 {format_datetime_short(application['schedule_datetime'])}\n"
-            f"⏰ 근무시간: {format_duration(application['duration_minutes'])}"
-        )
+    data = request.get_json(silent=True) or {}
+    user_id = extract_user_id(data)
+    
+    # application_id 추출 (clientExtra 우선, 없으면 params)
+    action = data.get('action') or {}
+    application_id = (
+        (action.get('clientExtra') or {}).get('application_id')
+        or (action.get('params') or {}).get('application_id')
+    )
+    
+    log.info(
+        "API Call: /cancel | User: %s | App ID: %s", user_id, application_id
+    )
+    
+    if not application_id:
+        return simple_text("❌ 취소할 신청을 선택해주세요.")
+    
+    conn = get_db()
+    cursor = get_cursor()
+    
+    # 신청 정보 조회
+    cursor.execute("""
+        SELECT a.schedule_id, s.schedule_datetime, s.duration_minutes
+        FROM applications a
+        JOIN schedules s ON a.schedule_id = s.id
+        WHERE a.id = %s AND a.user_id = %s
+    """, (application_id, user_id))
+    
+    application = cursor.fetchone()
+    
+    if not application:
+        return simple_text("❌ 취소할 신청을 찾을 수 없습니다.")
+    
+    schedule_id, schedule_datetime, duration_minutes = application
+    
+    # 신청 삭제
+    cursor.execute("DELETE FROM applications WHERE id = %s", (application_id,))
     
-    except Exception as e:
-        current_app.logger.error(f"신청 취소 실패: {str(e)}", exc_info=True)
-        return simple_text("❌ 신청 취소에 실패했습니다.")
+    # 스케줄 인원 감소
+    cursor.execute("""
+        UPDATE schedules 
+        SET current_count = current_count - 1 
+        WHERE id = %s
+    """, (schedule_id,))
     
-    finally:
-        if cursor:
-            cursor.close()
-        if conn:
-            conn.close()
+    conn.commit()
+    invalidate_status_cache()
+    
+    log.info(
+        "신청 취소 완료: User=%s, Schedule=%s", user_id, schedule_id
+    )
+    
+    return simple_text(
+        f"✅ 신청이 취소되었습니다.\n\n"
+        f"📅 {format_datetime_short(schedule_datetime)}\n"
+        f"⏰ 근무시간: {format_duration(duration_minutes)}"
+    )
 
 
 @bp.route('/status', methods=['POST'])
+@handle_errors('현황 조회')
 def get_status():
     """
     전체 현황 조회 API
     
     사용자가 "결과" 발화 시 호출
     """
-    conn = None
-    cursor = None
+    log = current_app.logger
     
-    try:
-        data = request.json
-        user_id = data['userRequest']['user']['id']
-        
-        current_app.logger.info(f"API Call: /status | User: {user_id}")
-        
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-        
-        # 미래 스케줄 조회
-        cursor.execute("""
-            SELECT * FROM schedules 
-            WHERE schedule_datetime >= NOW()
-            ORDER BY schedule_datetime
-            LIMIT 20
-        """)
-        
-        schedules = cursor.fetchall()
-        
-        if not schedules:
-            return simple_text(
-                "📅 등록된 스케줄이 없습니다.\n\n"
-                "관리자가 스케줄을 등록할 때까지 기다려주세요."
-            )
-        
-        # ListCard 생성
-        items = []
-        for schedule in schedules:
-            dt = schedule['schedule_datetime']
-            
-            # 상태 표시
-            if schedule['current_count'] >= schedule['capacity']:
-                status = "🔴 마감"
-            elif schedule['current_count'] > 0:
-                status = "🟡 모집중"
-            else:
-                status = "🟢 모집중"
-            
-            items.append({
-                "title": f"{format_datetime_short(dt)} | {status}",
-                "description": (
-                    f"⏰ 근무시간: {format_duration(schedule['duration_minutes'])}\n"
-                    f"👥 인원: {schedule['current_count']}/{schedule['capacity']}명"
-                )
-            })
-        
-        return list_card(
-            title="📅 스케줄 현황",
-            items=items
-        )
+    data = request.get_json(silent=True) or {}
+    user_id = extract_user_id(data)
+    
+    log.info("API Call: /status | User: %s", user_id)
+    
+    # 캐시 확인 (TTL 내 직렬화된 응답 재사용)
+    cached = get_cached_status()
+    if cached is not None:
+        return json_response(cached)
+    
+    cursor = get_cursor()
+    
+    # 미래 스케줄 조회 (상태 표시는 SQL에서 함께 계산)
+    cursor.execute("""
+        SELECT 
+            schedule_datetime,
+            duration_minutes,
+            capacity,
+            current_count,
+            CASE
+                WHEN current_count >= capacity THEN '🔴 마감'
+                WHEN current_count > 0 THEN '🟡 모집중'
+                ELSE '🟢 모집중'
+            END AS status
+        FROM schedules 
+        WHERE schedule_datetime >= NOW()
+        ORDER BY schedule_datetime
+        LIMIT 20
+    """)
+    
+    schedules = cursor.fetchall()
     
-    except Exception as e:
-        current_app.logger.error(f"현황 조회 실패: {str(e)}", exc_info=True)
-        return simple_text("❌ 현황 조회에 실패했습니다.")
+    if not schedules:
+        set_cached_status(NO_SCHEDULES_BODY)
+        return json_response(NO_SCHEDULES_BODY)
     
-    finally:
-        if cursor:
-            cursor.close()
-        if conn:
-            conn.close()
+    # ListCard 생성
+    body = serialize(list_card_from_rows("📅 스케줄 현황", schedules, _status_item, []))
+    set_cached_status(body)
+    return json_response(body)
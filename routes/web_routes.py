@@ -5,12 +5,82 @@
 - 관리자 에러 대시보드
 """
 
+import os
+from collections import namedtuple
 from flask import Blueprint, render_template, current_app
-from utils.db import get_db_connection
-from utils.datetime_parser import format_datetime_korean
+from utils.db import get_db
+from utils.cache import get_cached_status_page, set_cached_status_page
+from utils.logging_setup import ERROR_LOG_FILE
 
 bp = Blueprint('web', __name__, url_prefix='/web')
 
+# 웹 현황 페이지 최대 표시 스케줄 수
+STATUS_PAGE_LIMIT = 200
+
+# 웹 현황 페이지 조회 시 한 번에 가져올 행 수
+STATUS_PAGE_FETCH_SIZE = 50
+
+# 웹 현황 페이지 행 (SELECT 컬럼 순서와 동일, 템플릿에서 속성으로 접근)
+StatusRow = namedtuple(
+    'StatusRow',
+    'datetime duration_hours capacity current_count is_full created_at'
+)
+
+# 에러 대시보드 설정
+ERROR_LOG_LIMIT = 50
+
+# JSON 로그의 에러 라인 접두사 (JsonLineFormatter 참고)
+_ERROR_LINE_PREFIX = b'{"level":"ERROR"'
+
+# 로그 파일을 뒤에서부터 읽는 단위 (bytes)
+_TAIL_CHUNK_SIZE = 8192
+
+
+def _tail_error_lines(path, limit):
+    """
+    로그 파일 끝에서부터 ERROR 라인 수집 (JSON 파싱 전 원본)
+    
+    파일 전체를 읽지 않고 끝에서부터 청크 단위로 거슬러 읽다가
+    limit개를 모으면 멈춥니다. (로그 크기와 무관하게 필요한 만큼만 읽음)
+    
+    Args:
+        path (str): 로그 파일 경로
+        limit (int): 최대 라인 수
+    
+    Returns:
+        list: ERROR 라인 bytes 리스트 (최신순)
+    
+    Raises:
+        FileNotFoundError: 로그 파일이 없는 경우
+    """
+    error_lines = []
+    
+    with open(path, 'rb') as f:
+        position = f.seek(0, os.SEEK_END)
+        remainder = b''
+        
+        while position > 0:
+            read_size = min(_TAIL_CHUNK_SIZE, position)
+            position -= read_size
+            f.seek(position)
+            
+            lines = (f.read(read_size) + remainder).split(b'\n')
+            
+            # 첫 조각은 앞 청크와 이어질 수 있으므로 다음 청크와 합쳐서 처리
+            remainder = lines[0]
+            
+            for line in reversed(lines[1:]):
+                if line.startswith(_ERROR_LINE_PREFIX):
+                    error_lines.append(line)
+                    if len(error_lines) >= limit:
+                        return error_lines
+        
+        # 파일 첫 줄
+        if remainder.startswith(_ERROR_LINE_PREFIX):
+            error_lines.append(remainder)
+    
+    return error_lines
+
 
 @bp.route('/status')
 def status_page():
@@ -25,55 +95,61 @@ def status_page():
     
     Returns:
         HTML: 스케줄 테이블
+    
+    Note:
+        - 하루 전 이후 스케줄만 시간순으로 최대 STATUS_PAGE_LIMIT개 표시
+        - 렌더링된 HTML은 캐시 (신청/스케줄 변경 시 무효화)
+        - 행은 STATUS_PAGE_FETCH_SIZE개씩 가져오며 렌더링 중에 StatusRow로 감쌈
+          (기본 커서는 버퍼링하지 않으므로 드라이버도 나눠서 수신)
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
+    html = get_cached_status_page()
+    if html is not None:
+        return html
+    
+    cursor = get_db().cursor()
     
     try:
         cursor.execute("""
             SELECT 
-                id,
                 schedule_datetime,
-                duration_minutes,
+                duration_minutes DIV 60 AS duration_hours,
                 capacity,
                 current_count,
+                current_count >= capacity AS is_full,
                 created_at
             FROM schedules
+            WHERE schedule_datetime >= NOW() - INTERVAL 1 DAY
             ORDER BY schedule_datetime
-        """)
+            LIMIT %s
+        """, (STATUS_PAGE_LIMIT,))
         
-        schedules = cursor.fetchall()
+        # 빈 목록/마지막 업데이트 표시를 위해 첫 묶음만 미리 조회
+        first_batch = cursor.fetchmany(STATUS_PAGE_FETCH_SIZE)
         
-        # 데이터 가공
-        schedule_list = []
-        for row in schedules:
-            schedule_id, schedule_dt, duration_mins, capacity, current_count, created_at = row
+        def iter_schedules():
+            """나머지 행은 템플릿 반복 중에 묶음 단위로 조회"""
+            batch = first_batch
             
-            # 색상 클래스 결정
-            if current_count >= capacity:
-                status_class = 'full'  # 마감
-            else:
-                status_class = 'available'  # 미달
-            
-            schedule_list.append({
-                'id': schedule_id,
-                'datetime': schedule_dt,
-                'datetime_korean': format_datetime_korean(schedule_dt),
-                'duration_hours': duration_mins // 60,
-                'capacity': capacity,
-                'current_count': current_count,
-                'status_class': status_class,
-                'created_at': created_at
-            })
+            while batch:
+                # 행마다 dict를 만들지 않고 튜플을 그대로 전달 (시간 단위/마감 여부는 SQL에서 계산)
+                yield from map(StatusRow._make, batch)
+                batch = cursor.fetchmany(STATUS_PAGE_FETCH_SIZE)
+        
+        html = render_template(
+            'status.html',
+            schedules=iter_schedules(),
+            has_schedules=bool(first_batch),
+            last_updated=StatusRow._make(first_batch[0]).created_at if first_batch else None
+        )
+        set_cached_status_page(html)
         
-        return render_template('status.html', schedules=schedule_list)
+        return html
     
     except Exception as e:
-        current_app.logger.error(f"Status page error: {str(e)}", exc_info=True)
+        current_app.logger.error("Status page error: %s", e, exc_info=True)
         return f"<h1>서버 에러</h1><p>{str(e)}</p>", 500
     finally:
         cursor.close()
-        conn.close()
 
 
 @bp.route('/admin/errors')
@@ -87,26 +163,23 @@ def admin_errors():
     
     Returns:
         HTML: 에러 로그 테이블
+    
+    Note:
+        인증 없이 열리는 페이지이므로 메시지 한 줄만 표시
+        (exc_info 트레이스백에는 파일 경로/SQL/파라미터가 포함됨)
     """
     try:
-        # 로그 파일 읽기
-        with open('logs/error.log', 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        # 최근 50개만
-        recent_lines = lines[-50:] if len(lines) > 50 else lines
-        recent_lines.reverse()  # 최신순
-        
-        # 에러만 필터링
-        error_logs = []
-        for line in recent_lines:
-            if 'ERROR' in line:
-                error_logs.append(line.strip())
+        # 로그 파일 끝에서부터 최근 에러만 읽기 (최신순)
+        # JSON 파싱은 앱 JSON Provider 사용 (orjson 설치 시 orjson)
+        error_logs = [
+            current_app.json.loads(line)
+            for line in _tail_error_lines(ERROR_LOG_FILE, ERROR_LOG_LIMIT)
+        ]
         
         return render_template('admin_errors.html', logs=error_logs)
     
     except FileNotFoundError:
         return "<h1>로그 파일이 없습니다</h1>", 404
     except Exception as e:
-        current_app.logger.error(f"Admin errors page error: {str(e)}", exc_info=True)
+        current_app.logger.error("Admin errors page error: %s", e, exc_info=True)
         return f"<h1>서버 에러</h1><p>{str(e)}</p>", 500
@@ -0,0 +1,37 @@
+"""
+gevent WSGI 서버 실행 스크립트
+
+Gunicorn 없이 단일 프로세스로 실행할 때 사용합니다. (예: Windows, 소규모 서버)
+MySQL 응답을 기다리는 동안 다른 요청을 처리하므로
+한 프로세스로도 많은 동시 웹훅을 받을 수 있습니다.
+
+실행 방법:
+  python server.py
+
+Note:
+    - monkey.patch_all()은 다른 모든 import보다 먼저 실행되어야 함
+    - C 확장 드라이버는 gevent에 양보하지 않으므로 순수 파이썬 드라이버 사용
+    - 멀티 코어 활용은 Gunicorn gevent 워커 사용 (gunicorn.conf.py 참고)
+"""
+
+from gevent import monkey
+monkey.patch_all()
+
+import os
+
+os.environ.setdefault('DB_USE_PURE', 'true')
+
+# gevent 워커 1개와 같은 기준으로 Connection Pool 크기 결정 (config._default_pool_size)
+os.environ.setdefault('GUNICORN_WORKER_CLASS', 'gevent')
+os.environ.setdefault('GUNICORN_WORKERS', '1')
+
+from gevent.pywsgi import WSGIServer
+from app import app
+
+
+if __name__ == '__main__':
+    host = os.environ.get('SERVER_HOST', '0.0.0.0')
+    port = int(os.environ.get('SERVER_PORT', 5000))
+
+    app.logger.info(f"✅ gevent WSGI server listening on {host}:{port}")
+    WSGIServer((host, port), app).serve_forever()
@@ -0,0 +1,34 @@
+-- 인덱스 마이그레이션 (기존 DB용)
+-- schema.sql로 새로 생성한 DB에는 실행할 필요 없음
+-- 배포 시 1회 실행
+
+USE scheduledb;  -- 본인의 DB 이름으로 변경
+
+-- 1. 스케줄 범위 검색 인덱스
+-- WHERE schedule_datetime >= %s AND schedule_datetime < %s [AND duration_minutes = %s]
+-- 조건을 인덱스 안에서 판정 (InnoDB 보조 인덱스는 PK(id) 자동 포함)
+-- current_count는 신청/취소마다 갱신되므로 인덱스에 넣지 않음 (쓰기마다 보조 인덱스 재작성 방지)
+ALTER TABLE schedules
+    DROP INDEX idx_datetime,
+    ADD INDEX idx_datetime_cover (schedule_datetime, duration_minutes, capacity);
+
+-- 2. 중복 인덱스 제거 (신청 내역)
+-- 기존 idx_user(user_id)는 unique_application(user_id, schedule_id)의 앞부분과 중복
+-- WHERE user_id = %s 조회는 unique_application으로 처리 (정렬은 JOIN한 schedule_datetime 기준)
+ALTER TABLE applications
+    DROP INDEX idx_user;
+
+-- 3. 중복 인덱스 제거 (UNIQUE(user_id)와 동일, 쓰기 비용만 증가)
+ALTER TABLE users
+    DROP INDEX idx_user_id;
+
+-- 참고: 아래 인덱스는 schema.sql에 이미 존재
+-- - admins.user_id: PRIMARY KEY (is_admin / is_super_admin 조회)
+-- - applications(user_id, schedule_id): unique_application (중복 신청 방지, INSERT IGNORE)
+-- - applications(schedule_id, user_id): idx_schedule_user (JOIN 조회)
+-- - schedules(schedule_datetime): uq_schedule (중복 등록 방지, INSERT IGNORE)
+
+-- 인덱스 확인
+SHOW INDEX FROM schedules;
+SHOW INDEX FROM applications;
+SHOW INDEX FROM users;
@@ -12,25 +12,13 @@ INSERT INTO users (user_id, nickname) VALUES
 -- 2. 테스트 스케줄 5개 (다양한 정원)
 -- 현재 날짜 기준 앞으로 7일간의 스케줄 생성
 
--- 정원 1명 (동시성 테스트용)
+-- 한 번의 INSERT로 일괄 등록 (스케줄별 왕복 제거)
 INSERT INTO schedules (schedule_datetime, duration_minutes, capacity, current_count) VALUES
-(DATE_ADD(NOW(), INTERVAL 1 DAY) + INTERVAL 11 HOUR, 240, 1, 0);
-
--- 정원 5명
-INSERT INTO schedules (schedule_datetime, duration_minutes, capacity, current_count) VALUES
-(DATE_ADD(NOW(), INTERVAL 1 DAY) + INTERVAL 17 HOUR, 240, 5, 0);
-
--- 정원 8명
-INSERT INTO schedules (schedule_datetime, duration_minutes, capacity, current_count) VALUES
-(DATE_ADD(NOW(), INTERVAL 2 DAY) + INTERVAL 11 HOUR, 240, 8, 0);
-
--- 정원 7명
-INSERT INTO schedules (schedule_datetime, duration_minutes, capacity, current_count) VALUES
-(DATE_ADD(NOW(), INTERVAL 2 DAY) + INTERVAL 17 HOUR, 240, 7, 0);
-
--- 정원 10명
-INSERT INTO schedules (schedule_datetime, duration_minutes, capacity, current_count) VALUES
-(DATE_ADD(NOW(), INTERVAL 3 DAY) + INTERVAL 11 HOUR, 240, 10, 0);
+(DATE_ADD(NOW(), INTERVAL 1 DAY) + INTERVAL 11 HOUR, 240, 1, 0),   -- 정원 1명 (동시성 테스트용)
+(DATE_ADD(NOW(), INTERVAL 1 DAY) + INTERVAL 17 HOUR, 240, 5, 0),   -- 정원 5명
+(DATE_ADD(NOW(), INTERVAL 2 DAY) + INTERVAL 11 HOUR, 240, 8, 0),   -- 정원 8명
+(DATE_ADD(NOW(), INTERVAL 2 DAY) + INTERVAL 17 HOUR, 240, 7, 0),   -- 정원 7명
+(DATE_ADD(NOW(), INTERVAL 3 DAY) + INTERVAL 11 HOUR, 240, 10, 0);  -- 정원 10명
 
 -- 3. 테스트 신청 2개 (테스터1, 테스터2가 첫 번째 스케줄 신청)
 -- 실제 테스트 시 자동으로 생성되므로 선택적
@@ -6,8 +6,8 @@ CREATE TABLE IF NOT EXISTS users (
     id INT AUTO_INCREMENT PRIMARY KEY,
     user_id VARCHAR(100) UNIQUE NOT NULL COMMENT '카카오톡 user_id',
     nickname VARCHAR(255) NOT NULL COMMENT '유저 닉네임 (길이 제한 없음, 중복 허용)',
-    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-    INDEX idx_user_id (user_id)
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    -- user_id 조회는 UNIQUE 인덱스 사용 (별도 인덱스 불필요)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
 COMMENT='사용자 정보';
 
@@ -32,8 +32,10 @@ CREATE TABLE IF NOT EXISTS schedules (
     -- 유일성: 같은 시간대에 중복 스케줄 방지
     UNIQUE KEY uq_schedule (schedule_datetime),
     
-    -- 범위 검색 최적화 (>= AND < 쿼리)
-    INDEX idx_datetime (schedule_datetime)
+    -- 범위 검색 인덱스 (>= AND < 쿼리 + duration_minutes 일치)
+    -- 변경되지 않는 컬럼만 포함 (InnoDB 보조 인덱스는 PK(id)를 자동 포함)
+    -- current_count는 /apply, /cancel마다 갱신되므로 제외하고 클러스터드 행에서 읽음
+    INDEX idx_datetime_cover (schedule_datetime, duration_minutes, capacity)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
 COMMENT='스케줄 정보';
 
@@ -51,8 +53,8 @@ CREATE TABLE IF NOT EXISTS applications (
     -- 중복 신청 방지 (유저당 스케줄 1개만)
     UNIQUE KEY unique_application (user_id, schedule_id),
     
-    -- 인덱스: 취소 목록 조회 최적화
-    INDEX idx_user (user_id),
+    -- 내 신청 내역 조회(WHERE user_id = %s)는 unique_application의 앞부분(user_id) 사용
+    -- 정렬 기준은 schedules.schedule_datetime(JOIN 후)이므로 별도 인덱스로 대체 불가
     
     -- 인덱스: 결과 조회 최적화
     INDEX idx_schedule_user (schedule_id, user_id)
@@ -7,15 +7,32 @@
 실행 방법:
   로컬 테스트: python concurrent_test.py --url http://localhost:5000
   서버 테스트: python concurrent_test.py --url https://yourusername.pythonanywhere.com
+
+Note:
+    asyncio + aiohttp로 단일 스레드에서 동시 요청 (pip install aiohttp)
 """
 
-import requests
-import threading
+import aiohttp
+import asyncio
 import time
 import json
 import argparse
+from collections import Counter
 from datetime import datetime, timedelta
 
+try:
+    import orjson
+except ImportError:  # orjson 휠이 없는 환경 (PyPy 등)
+    orjson = None
+
+
+# 동시 신청 최대 인원 (테스트 케이스 중 최대값)
+MAX_CONCURRENT_USERS = 10
+
+# /apply 응답의 data.result_code (routes/user_routes.py와 동일)
+RESULT_SUCCESS = 0
+RESULT_FULL = 1
+
 
 class ConcurrentTester:
     """동시성 테스트 실행 및 결과 리포트 생성"""
@@ -23,6 +40,24 @@ class ConcurrentTester:
     def __init__(self, base_url):
         self.base_url = base_url
         self.test_results = []
+        self.session = None
+    
+    async def open(self, max_connections=MAX_CONCURRENT_USERS):
+        """
+        HTTP 세션 생성 (이벤트 루프 안에서 호출)
+        
+        Keep-Alive 연결을 모든 반복에서 재사용하여
+        매 요청마다 TCP/TLS 핸드셰이크를 생략합니다.
+        """
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=max_connections, keepalive_timeout=30),
+            timeout=aiohttp.ClientTimeout(total=5)
+        )
+    
+    async def close(self):
+        """HTTP 세션 정리"""
+        if self.session is not None:
+            await self.session.close()
     
     def create_schedule(self, capacity):
         """
@@ -34,9 +69,8 @@ class ConcurrentTester:
         Returns:
             int: 생성된 schedule_id
         """
-        # 관리자로 스케줄 등록
-        tomorrow = datetime.now() + timedelta(days=1)
-        day = tomorrow.day
+        # 관리자로 스케줄 등록 (테스트 시작 시각 기준 내일)
+        day = self.tomorrow_day
         hour = 11
         
         # 임시로 admin API 호출 (실제로는 DB 직접 INSERT)
@@ -47,7 +81,7 @@ class ConcurrentTester:
         # 여기서는 schedule_id를 반환한다고 가정
         return 1  # 임시 ID
     
-    def apply_concurrent(self, schedule_id, user_count):
+    async def apply_concurrent(self, schedule_id, user_count):
         """
         동시 신청 실행
         
@@ -62,19 +96,19 @@ class ConcurrentTester:
                 'response_times': [응답 시간 리스트]
             }
         """
-        responses = []
-        status_codes = []
-        response_times = []
-        lock = threading.Lock()
-        
-        def apply_single(user_index):
-            """단일 유저 신청"""
+        async def apply_single(user_index):
+            """
+            단일 유저 신청
+            
+            Returns:
+                tuple: (응답, 상태 코드, 응답 시간)
+            """
             user_id = f"test_user_{user_index}"
             
             start_time = time.time()
             
             try:
-                response = requests.post(
+                async with self.session.post(
                     f"{self.base_url}/apply",
                     json={
                         "userRequest": {
@@ -87,37 +121,23 @@ class ConcurrentTester:
                                 "@time_hour": "11"
                             }
                         }
-                    },
-                    timeout=5
-                )
+                    }
+                ) as response:
+                    body = await response.json(content_type=None)
                 
                 elapsed = time.time() - start_time
-                
-                with lock:
-                    responses.append(response.json())
-                    status_codes.append(response.status_code)
-                    response_times.append(elapsed)
+                return body, response.status, elapsed
             
             except Exception as e:
                 elapsed = time.time() - start_time
-                with lock:
-                    responses.append({"error": str(e)})
-                    status_codes.append(0)
-                    response_times.append(elapsed)
+                return {"error": str(e)}, 0, elapsed
         
-        # 쓰레드 생성 및 실행
-        threads = []
-        for i in range(user_count):
-            thread = threading.Thread(target=apply_single, args=(i,))
-            threads.append(thread)
-        
-        # 동시 시작
-        for thread in threads:
-            thread.start()
-        
-        # 모든 쓰레드 종료 대기
-        for thread in threads:
-            thread.join()
+        # 단일 스레드에서 동시 실행, 각 작업의 반환값을 유저 순서대로 수집
+        # (공유 리스트를 쓰지 않으므로 잠금 불필요)
+        results = await asyncio.gather(*(apply_single(i) for i in range(user_count)))
+        responses, status_codes, response_times = (
+            list(column) for column in zip(*results)
+        )
         
         return {
             'responses': responses,
@@ -125,7 +145,7 @@ class ConcurrentTester:
             'response_times': response_times
         }
     
-    def verify_db_count(self, schedule_id, expected_count):
+    async def verify_db_count(self, schedule_id, expected_count):
         """
         DB에 실제로 저장된 신청 개수 확인
         
@@ -140,13 +160,13 @@ class ConcurrentTester:
         # 여기서는 GET /status API로 확인한다고 가정
         
         try:
-            response = requests.get(f"{self.base_url}/api/schedule/{schedule_id}")
-            data = response.json()
+            async with self.session.get(f"{self.base_url}/api/schedule/{schedule_id}") as response:
+                data = await response.json(content_type=None)
             return data.get('current_count', 0)
         except:
             return -1  # 조회 실패
     
-    def run_test_case(self, case_id, capacity, concurrent_users, iterations=10):
+    async def run_test_case(self, case_id, capacity, concurrent_users, iterations=10):
         """
         단일 테스트 케이스 실행 (10회 반복)
         
@@ -172,10 +192,10 @@ class ConcurrentTester:
             schedule_id = self.create_schedule(capacity)
             
             # 2. 동시 신청
-            result = self.apply_concurrent(schedule_id, concurrent_users)
+            result = await self.apply_concurrent(schedule_id, concurrent_users)
             
             # 3. DB 확인
-            db_count = self.verify_db_count(schedule_id, capacity)
+            db_count = await self.verify_db_count(schedule_id, capacity)
             
             # 4. 검증
             verification = self.verify_results(
@@ -202,7 +222,7 @@ class ConcurrentTester:
             
             # 다음 반복 전 대기
             if iteration < iterations:
-                time.sleep(0.5)
+                await asyncio.sleep(0.5)
         
         # 전체 통과율 계산
         pass_count = sum(1 for r in case_results if r['status'] == 'PASS')
@@ -236,15 +256,12 @@ class ConcurrentTester:
         status_codes = result['status_codes']
         response_times = result['response_times']
         
-        # 검증 1: 응답 일관성
-        success_count = sum(
-            1 for r in responses 
-            if '신청이 완료되었습니다' in str(r)
-        )
-        fail_count = sum(
-            1 for r in responses 
-            if '정원이 마감되었습니다' in str(r)
+        # 검증 1: 응답 일관성 (응답 문구 대신 결과 코드로 집계)
+        result_codes = Counter(
+            r.get('data', {}).get('result_code') for r in responses
         )
+        success_count = result_codes[RESULT_SUCCESS]
+        fail_count = result_codes[RESULT_FULL]
         
         consistency_pass = (success_count == capacity) and (db_count == capacity)
         
@@ -290,7 +307,7 @@ class ConcurrentTester:
         print(f"  ✓ Errors: {'PASS' if verification['errors']['pass'] else 'FAIL'}")
         print(f"  Status: {'✅ PASS' if verification['all_passed'] else '❌ FAIL'}")
     
-    def run_all_tests(self):
+    async def run_all_tests(self):
         """
         6개 케이스 모두 실행
         
@@ -311,10 +328,14 @@ class ConcurrentTester:
             (6, 10, 10),  # TC6
         ]
         
+        # 테스트 시작 시각 (실행 시작 시 한 번만 기록, 자정을 넘겨도 날짜 고정)
+        self.run_started_at = datetime.now()
+        self.tomorrow_day = (self.run_started_at + timedelta(days=1)).day
+        
         all_results = []
         
         for case_id, capacity, concurrent_users in test_cases:
-            result = self.run_test_case(case_id, capacity, concurrent_users)
+            result = await self.run_test_case(case_id, capacity, concurrent_users)
             all_results.append(result)
             self.test_results.append(result)
         
@@ -331,7 +352,7 @@ class ConcurrentTester:
         failed_tests = total_tests - passed_tests
         
         report = {
-            'test_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'test_date': self.run_started_at,
             'base_url': self.base_url,
             'cases': self.test_results,
             'summary': {
@@ -343,9 +364,13 @@ class ConcurrentTester:
             }
         }
         
-        # JSON 파일 저장
-        with open('test_report.json', 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        # JSON 파일 저장 (orjson: 한글/datetime을 그대로 빠르게 직렬화)
+        if orjson is not None:
+            with open('test_report.json', 'wb') as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open('test_report.json', 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False, default=datetime.isoformat)
         
         print(f"\n{'='*60}")
         print("TEST REPORT GENERATED: test_report.json")
@@ -357,6 +382,23 @@ class ConcurrentTester:
         print(f"{'='*60}\n")
 
 
+async def run(base_url):
+    """
+    테스트 실행 및 리포트 생성
+    
+    Args:
+        base_url (str): 서버 URL
+    """
+    tester = ConcurrentTester(base_url)
+    await tester.open()
+    
+    try:
+        await tester.run_all_tests()
+        tester.generate_report()
+    finally:
+        await tester.close()
+
+
 def main():
     """메인 실행 함수"""
     parser = argparse.ArgumentParser(description='동시성 테스트 스크립트')
@@ -372,13 +414,9 @@ def main():
     print(f"Total tests: 60")
     print("="*60)
     
-    # 테스터 초기화
-    tester = ConcurrentTester(args.url)
-    
     # 모든 테스트 실행
     try:
-        tester.run_all_tests()
-        tester.generate_report()
+        asyncio.run(run(args.url))
     except KeyboardInterrupt:
         print("\n\n테스트 중단됨")
     except Exception as e:
@@ -0,0 +1,13 @@
+"""
+pytest 공통 설정
+
+- 프로젝트 루트를 import 경로에 추가 (tests/에서 실행해도 utils 패키지 사용)
+- concurrent_test.py는 실행 중인 서버가 필요한 부하 테스트 스크립트이므로 수집 제외
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+collect_ignore = ['concurrent_test.py']
@@ -0,0 +1,84 @@
+"""
+utils.auth 관리자 캐시 단위 테스트
+
+관리자 추가/삭제가 기존 dict를 수정하지 않고 새 dict로 교체하는지(copy-on-write),
+TTL 안에서는 DB 없이 캐시로 권한을 확인하는지 검증합니다.
+"""
+
+import time
+from datetime import datetime
+
+import pytest
+
+from utils import auth
+
+
+ADDED_AT = datetime(2025, 1, 1, 9, 0)
+
+
+@pytest.fixture
+def admin_cache(monkeypatch):
+    """슈퍼 관리자 1명이 로드된 최신 캐시"""
+    loaded_at = time.monotonic()
+    monkeypatch.setattr(auth, '_admin_cache', (loaded_at, {'root': ('system', ADDED_AT)}))
+
+    # TTL 안에서는 DB를 조회하면 안 됨
+    def fail_load(conn=None):
+        raise AssertionError("TTL 안에서 DB 조회")
+    monkeypatch.setattr(auth, '_load_admins', fail_load)
+
+    return loaded_at
+
+
+def test_added_replaces_dict(admin_cache):
+    _, before = auth._admin_cache
+
+    auth.cache_admin_added('alice', 'root')
+
+    loaded_at, after = auth._admin_cache
+    assert after is not before
+    assert 'alice' not in before
+    assert after['alice'][0] == 'root'
+    assert after['root'] == ('system', ADDED_AT)
+    # 로드 시각은 그대로 (다음 TTL 재로드 시점 유지)
+    assert loaded_at == admin_cache
+
+
+def test_removed_replaces_dict(admin_cache):
+    auth.cache_admin_added('alice', 'root')
+    _, before = auth._admin_cache
+
+    auth.cache_admin_removed('alice')
+
+    loaded_at, after = auth._admin_cache
+    assert after is not before
+    assert 'alice' in before
+    assert 'alice' not in after
+    assert loaded_at == admin_cache
+
+
+def test_removed_unknown_user(admin_cache):
+    auth.cache_admin_removed('nobody')
+    assert set(auth._admin_cache[1]) == {'root'}
+
+
+def test_permissions_from_cache(admin_cache):
+    auth.cache_admin_added('alice', 'root')
+
+    assert auth.is_admin('root')
+    assert auth.is_super_admin('root')
+    assert auth.is_admin('alice')
+    assert not auth.is_super_admin('alice')
+
+    auth.cache_admin_removed('alice')
+
+    assert not auth.is_admin('alice')
+    assert not auth.is_admin('nobody')
+
+
+def test_expired_cache_reloads(monkeypatch):
+    monkeypatch.setattr(auth, '_admin_cache', (time.monotonic() - auth.ADMIN_CACHE_TTL, {}))
+    monkeypatch.setattr(auth, '_load_admins', lambda conn=None: {'bob': ('root', ADDED_AT)})
+
+    assert auth.is_admin('bob')
+    assert auth._admin_cache[1] == {'bob': ('root', ADDED_AT)}
@@ -0,0 +1,148 @@
+"""
+utils.datetime_parser 단위 테스트
+
+숫자 추출(extract_numbers), 날짜 계산(resolve_schedule_datetime),
+캐시 래퍼(*_cached)의 경계 조건을 확인합니다.
+"""
+
+from datetime import date, datetime
+
+import pytest
+
+from utils.datetime_parser import (
+    extract_number,
+    extract_numbers,
+    resolve_schedule_datetime,
+    parse_user_input,
+    parse_user_input_cached,
+    parse_admin_schedule,
+    parse_admin_schedule_cached,
+)
+
+
+class TestExtractNumbers:
+    """여러 필드를 한 번에 파싱하는 extract_numbers"""
+
+    def test_korean_suffixes(self):
+        assert extract_numbers("27일", "11시", "4시간", "5명") == (27, 11, 4, 5)
+
+    def test_plain_digits(self):
+        assert extract_numbers("3", "18", "0") == (3, 18, 0)
+
+    def test_first_number_per_field(self):
+        # 필드 안에 숫자가 여러 개면 첫 숫자만 사용, 다음 필드로 넘어가지 않음
+        assert extract_numbers("3일 5", "11시") == (3, 11)
+
+    def test_matches_extract_number(self):
+        texts = ("1일", "23시", "30분", "12시간", "10명")
+        assert extract_numbers(*texts) == tuple(extract_number(t) for t in texts)
+
+    @pytest.mark.parametrize("texts", [
+        ("월요일", "11시"),
+        ("3일", "시"),
+        ("3일", ""),
+    ])
+    def test_field_without_digits(self, texts):
+        with pytest.raises(ValueError):
+            extract_numbers(*texts)
+
+    def test_none(self):
+        with pytest.raises(ValueError):
+            extract_numbers("3일", None)
+
+    def test_non_ascii_digits_are_not_fast_pathed(self):
+        # 전각 숫자는 isdigit()이 True지만 ASCII 빠른 경로를 타지 않음
+        assert extract_number("２７일") == 27
+
+
+class TestResolveScheduleDatetime:
+    """지난 일이면 다음 달로 넘기는 날짜 계산"""
+
+    def test_today_stays_in_month(self):
+        assert resolve_schedule_datetime(15, 9, today=datetime(2025, 3, 15, 20)) == \
+            datetime(2025, 3, 15, 9, 0)
+
+    def test_future_day_in_month(self):
+        assert resolve_schedule_datetime(20, 11, today=datetime(2025, 3, 15)) == \
+            datetime(2025, 3, 20, 11, 0)
+
+    def test_past_day_rolls_to_next_month(self):
+        assert resolve_schedule_datetime(3, 11, 30, today=datetime(2025, 3, 15)) == \
+            datetime(2025, 4, 3, 11, 30)
+
+    def test_december_rolls_to_january(self):
+        assert resolve_schedule_datetime(3, 11, today=datetime(2025, 12, 27)) == \
+            datetime(2026, 1, 3, 11, 0)
+
+    def test_december_future_day_stays_in_year(self):
+        assert resolve_schedule_datetime(31, 9, today=datetime(2025, 12, 27)) == \
+            datetime(2025, 12, 31, 9, 0)
+
+    def test_last_day_of_month(self):
+        assert resolve_schedule_datetime(31, 9, today=datetime(2025, 1, 31)) == \
+            datetime(2025, 1, 31, 9, 0)
+
+    def test_end_of_month_rolls_to_first(self):
+        assert resolve_schedule_datetime(1, 9, today=datetime(2025, 1, 31)) == \
+            datetime(2025, 2, 1, 9, 0)
+
+    def test_day_missing_in_next_month(self):
+        # 1월 31일 기준 30일 → 2월 30일은 없으므로 ValueError
+        with pytest.raises(ValueError):
+            resolve_schedule_datetime(30, 9, today=datetime(2025, 1, 31))
+
+    def test_day_missing_in_current_month(self):
+        with pytest.raises(ValueError):
+            resolve_schedule_datetime(31, 9, today=datetime(2025, 4, 15))
+
+    def test_leap_day(self):
+        assert resolve_schedule_datetime(29, 9, today=datetime(2024, 2, 10)) == \
+            datetime(2024, 2, 29, 9, 0)
+
+    def test_accepts_date(self):
+        # 캐시 래퍼는 date.today()를 기준 날짜로 넘김
+        assert resolve_schedule_datetime(3, 11, today=date(2025, 12, 27)) == \
+            datetime(2026, 1, 3, 11, 0)
+
+
+class TestParseUserInput:
+    """사용자 입력 → 1시간 범위"""
+
+    def test_range(self):
+        start, end = parse_user_input("3일", "11시", today=date(2025, 12, 27))
+        assert start == datetime(2026, 1, 3, 11, 0, 0)
+        assert end == datetime(2026, 1, 3, 11, 59, 59)
+
+    @pytest.mark.parametrize("day, hour, minute", [
+        ("32일", "11시", None),
+        ("0일", "11시", None),
+        ("3일", "24시", None),
+        ("3일", "11시", "60분"),
+        ("오늘", "11시", None),
+    ])
+    def test_invalid(self, day, hour, minute):
+        with pytest.raises(ValueError):
+            parse_user_input(day, hour, minute, today=date(2025, 3, 1))
+
+
+class TestCachedWrappers:
+    """lru_cache 래퍼는 캐시하지 않은 결과와 같아야 함"""
+
+    def test_user_input_cached_matches(self):
+        assert parse_user_input_cached("3일", "11시") == \
+            parse_user_input("3일", "11시", today=date.today())
+
+    def test_user_input_cached_failure_not_cached(self):
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                parse_user_input_cached("오늘", "11시")
+
+    def test_admin_schedule_cached_matches(self):
+        expected = parse_admin_schedule("3일", "11시", "0", "4시간", "5명", today=date.today())
+        assert parse_admin_schedule_cached("3일", "11시", "0", "4시간", "5명") == expected
+
+    def test_admin_schedule_cached_returns_copy(self):
+        first = parse_admin_schedule_cached("3일", "11시", "0", "4시간", "5명")
+        first['capacity'] = 99
+        second = parse_admin_schedule_cached("3일", "11시", "0", "4시간", "5명")
+        assert second['capacity'] == 5
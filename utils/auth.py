@@ -2,9 +2,116 @@
 관리자 인증 로직
 
 이 모듈은 일반 관리자와 슈퍼 관리자를 구분하여 인증합니다.
+관리자 목록은 앱 시작 시 프로세스 메모리에 로드하고 짧은 TTL로 갱신하여
+매 요청마다 admins 테이블을 조회하지 않습니다.
+관리자 추가/삭제는 다시 로드하지 않고 캐시에 바로 반영합니다.
 """
 
-from utils.db import get_db_connection
+import time
+from contextlib import closing
+from datetime import datetime
+from utils.db import get_db, db_conn
+from utils.cache import get_cached_nickname, cache_nickname
+
+
+# 관리자 캐시 유효 시간(초)
+# 멀티 워커 환경에서는 다른 워커의 캐시가 최대 이 시간만큼 늦게 갱신됨
+ADMIN_CACHE_TTL = 60
+
+# 관리자 캐시: (로드 시각, {user_id: (added_by, added_at)})
+_admin_cache = (0.0, {})
+
+
+def _load_admins(conn=None):
+    """
+    admins 테이블 전체 조회
+    
+    Args:
+        conn (MySQLConnection, optional): 사용할 연결 (기본값: 요청 범위 연결 get_db())
+    
+    Returns:
+        dict: {user_id: (added_by, added_at)}
+    """
+    # 커서는 예외 시에도 닫힘
+    with closing((conn or get_db()).cursor()) as cursor:
+        cursor.execute("SELECT user_id, added_by, added_at FROM admins")
+        return {user_id: (added_by, added_at) for user_id, added_by, added_at in cursor}
+
+
+def _get_admins():
+    """
+    캐시된 관리자 목록 반환 (TTL 만료 시 DB에서 재로드)
+    
+    Returns:
+        dict: {user_id: (added_by, added_at)}
+    """
+    global _admin_cache
+    
+    loaded_at, admins = _admin_cache
+    now = time.monotonic()
+    
+    if now - loaded_at >= ADMIN_CACHE_TTL:
+        admins = _load_admins()
+        _admin_cache = (now, admins)
+    
+    return admins
+
+
+def _admin_row(user_id):
+    """
+    관리자 한 명의 캐시 항목 조회
+    
+    is_admin / is_super_admin / get_admin_info가 공통으로 사용합니다.
+    
+    Args:
+        user_id (str): 카카오톡 user_id
+    
+    Returns:
+        tuple: (added_by, added_at) (관리자가 아니면 None)
+    """
+    return _get_admins().get(user_id)
+
+
+def warm_admin_cache():
+    """
+    관리자 캐시 예열
+    
+    앱 시작 시 호출하여 첫 요청부터 DB 조회 없이 권한을 확인합니다.
+    요청 밖에서 실행되므로 db_conn()으로 연결을 빌리고 바로 반납합니다.
+    """
+    global _admin_cache
+    with db_conn() as conn:
+        _admin_cache = (time.monotonic(), _load_admins(conn))
+
+
+def cache_admin_added(user_id, added_by):
+    """
+    관리자 추가를 캐시에 반영 (커밋 후 호출)
+    
+    다시 로드하지 않고 새 dict로 교체합니다 (copy-on-write).
+    다른 스레드는 교체 전 dict를 그대로 읽으므로 잠금이 필요 없습니다.
+    
+    Args:
+        user_id (str): 추가된 관리자 user_id
+        added_by (str): 추가한 관리자 user_id
+    """
+    global _admin_cache
+    loaded_at, admins = _admin_cache
+    _admin_cache = (loaded_at, {**admins, user_id: (added_by, datetime.now())})
+
+
+def cache_admin_removed(user_id):
+    """
+    관리자 삭제를 캐시에 반영 (커밋 후 호출, copy-on-write)
+    
+    Args:
+        user_id (str): 삭제된 관리자 user_id
+    """
+    global _admin_cache
+    loaded_at, admins = _admin_cache
+    admins = dict(admins)
+    admins.pop(user_id, None)
+    _admin_cache = (loaded_at, admins)
 
 
 def is_admin(user_id):
@@ -24,19 +131,7 @@ def is_admin(user_id):
         >>> is_admin("normal_user")
         False
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    try:
-        cursor.execute(
-            "SELECT 1 FROM admins WHERE user_id = %s",
-            (user_id,)
-        )
-        result = cursor.fetchone()
-        return bool(result)
-    finally:
-        cursor.close()
-        conn.close()
+    return _admin_row(user_id) is not None
 
 
 def is_super_admin(user_id):
@@ -59,24 +154,9 @@ def is_super_admin(user_id):
         >>> is_super_admin("normal_admin_id")
         False
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    try:
-        cursor.execute(
-            "SELECT added_by FROM admins WHERE user_id = %s",
-            (user_id,)
-        )
-        result = cursor.fetchone()
-        
-        if not result:
-            return False
-        
-        # added_by가 'system'인 경우만 슈퍼 관리자
-        return result[0] == 'system'
-    finally:
-        cursor.close()
-        conn.close()
+    # added_by가 'system'인 경우만 슈퍼 관리자
+    row = _admin_row(user_id)
+    return row is not None and row[0] == 'system'
 
 
 def get_admin_info(user_id):
@@ -94,31 +174,34 @@ def get_admin_info(user_id):
             'added_at': datetime or None
         }
         None: 관리자가 아닌 경우
+    
+    Note:
+        - 권한/추가 시간은 관리자 캐시에서, 닉네임은 닉네임 캐시에서 조회
+        - 닉네임이 캐시에 없을 때만 users 테이블 조회 (JOIN 없음)
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
+    row = _admin_row(user_id)
     
-    try:
-        cursor.execute("""
-            SELECT u.nickname, a.added_by, a.added_at
-            FROM admins a
-            JOIN users u ON a.user_id = u.user_id
-            WHERE a.user_id = %s
-        """, (user_id,))
-        
-        result = cursor.fetchone()
-        
-        if not result:
-            return None
-        
-        nickname, added_by, added_at = result
+    if row is None:
+        return None
+    
+    added_by, added_at = row
+    nickname = get_cached_nickname(user_id)
+    
+    if nickname is None:
+        with closing(get_db().cursor()) as cursor:
+            cursor.execute(
+                "SELECT nickname FROM users WHERE user_id = %s",
+                (user_id,)
+            )
+            result = cursor.fetchone()
         
-        return {
-            'is_admin': True,
-            'is_super_admin': (added_by == 'system'),
-            'nickname': nickname,
-            'added_at': added_at
-        }
-    finally:
-        cursor.close()
-        conn.close()
+        if result:
+            nickname = result[0]
+            cache_nickname(user_id, nickname)
+    
+    return {
+        'is_admin': True,
+        'is_super_admin': (added_by == 'system'),
+        'nickname': nickname,
+        'added_at': added_at
+    }
@@ -0,0 +1,121 @@
+"""
+조회 결과 캐시
+
+이 모듈은 자주 반복되는 조회 결과를 프로세스 메모리에 캐시합니다.
+- 현황(/status): 짧은 TTL, "결과" 버튼이 연달아 눌려도 TTL마다 한 번만 조회
+- 웹 현황 페이지(/web/status): 렌더링된 HTML을 TTL 동안 재사용
+- 닉네임: 등록 후 바뀌지 않으므로 TTL 없이 user_id별로 보관
+"""
+
+import time
+
+
+# 현황 캐시 유효 시간(초)
+# 스케줄 변경은 즉시 무효화하므로 TTL은 다른 워커의 변경 반영 지연 한도
+STATUS_CACHE_TTL = 5
+
+# 웹 현황 페이지 캐시 유효 시간(초)
+STATUS_PAGE_CACHE_TTL = 30
+
+# 현황 캐시: (저장 시각, 응답)
+_status_cache = (0.0, None)
+
+# 웹 현황 페이지 캐시: (저장 시각, HTML)
+_status_page_cache = (0.0, None)
+
+
+def get_cached_status():
+    """
+    캐시된 현황 응답 반환
+    
+    Returns:
+        bytes: 직렬화된 카카오톡 응답 (없거나 만료되었으면 None)
+    """
+    saved_at, response = _status_cache
+    
+    if time.monotonic() - saved_at < STATUS_CACHE_TTL:
+        return response
+    
+    return None
+
+
+def set_cached_status(response):
+    """
+    현황 응답 저장
+    
+    Args:
+        response (bytes): 직렬화된 카카오톡 응답 (kakao_response.serialize 결과)
+    """
+    global _status_cache
+    _status_cache = (time.monotonic(), response)
+
+
+def get_cached_status_page():
+    """
+    캐시된 웹 현황 페이지 반환
+    
+    Returns:
+        str: 렌더링된 HTML (없거나 만료되었으면 None)
+    """
+    saved_at, html = _status_page_cache
+    
+    if time.monotonic() - saved_at < STATUS_PAGE_CACHE_TTL:
+        return html
+    
+    return None
+
+
+def set_cached_status_page(html):
+    """
+    웹 현황 페이지 저장
+    
+    Args:
+        html (str): 렌더링된 HTML
+    """
+    global _status_page_cache
+    _status_page_cache = (time.monotonic(), html)
+
+
+def invalidate_status_cache():
+    """
+    현황 캐시 무효화 (챗봇 현황 + 웹 현황 페이지)
+    
+    신청/취소, 스케줄 등록/수정/삭제 커밋 직후 호출합니다.
+    """
+    global _status_cache, _status_page_cache
+    _status_cache = (0.0, None)
+    _status_page_cache = (0.0, None)
+
+
+# 닉네임 캐시 최대 항목 수 (초과 시 전체 비움)
+NICKNAME_CACHE_SIZE = 10000
+
+# 닉네임 캐시: {user_id: nickname}
+_nickname_cache = {}
+
+
+def get_cached_nickname(user_id):
+    """
+    캐시된 닉네임 반환
+    
+    Args:
+        user_id (str): 카카오톡 user_id
+    
+    Returns:
+        str: 닉네임 (캐시에 없으면 None)
+    """
+    return _nickname_cache.get(user_id)
+
+
+def cache_nickname(user_id, nickname):
+    """
+    닉네임 저장 (DB 조회 또는 사용자 등록 직후 호출)
+    
+    Args:
+        user_id (str): 카카오톡 user_id
+        nickname (str): 닉네임
+    """
+    if len(_nickname_cache) >= NICKNAME_CACHE_SIZE:
+        _nickname_cache.clear()
+    
+    _nickname_cache[user_id] = nickname
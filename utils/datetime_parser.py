@@ -12,7 +12,23 @@
 """
 
 import re
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+
+
+# 숫자 추출 정규식 (모듈 로드 시 1회 컴파일)
+# 스케줄 등록/수정/삭제 등 모든 웹훅에서 호출되므로 상수로 유지
+_NUMBER_RE = re.compile(r'\d+')
+
+# 여러 입력을 구분자(\x00)로 이어 붙인 문자열에서 필드별 첫 숫자 추출
+_FIELD_NUMBER_RE = re.compile(r'(?:^|\x00)[^\d\x00]*(\d+)')
+
+# 요일 표시 (datetime.weekday() 인덱스 순서, 0=월요일)
+_WEEKDAYS = ('월', '화', '수', '목', '금', '토', '일')
+
+# 요일별 strftime 포맷 (요일마다 미리 만들어 두어 호출 시 문자열 조립 생략)
+_SHORT_FORMATS = tuple(f"%m월 %d일 ({weekday}) %H:%M" for weekday in _WEEKDAYS)
+_KOREAN_FORMATS = tuple(f"%Y년 %m월 %d일 ({weekday}) %H:%M" for weekday in _WEEKDAYS)
 
 
 def extract_number(text):
@@ -41,14 +57,52 @@ def extract_number(text):
     if text is None:
         raise ValueError("입력값이 None입니다")
     
+    text = str(text)
+    
+    # 이미 숫자만 있는 경우 (예: "27") 정규식 생략
+    if text.isascii() and text.isdigit():
+        return int(text)
+    
     # 숫자만 추출 (정규식)
-    match = re.search(r'\d+', str(text))
+    match = _NUMBER_RE.search(text)
     if match:
         return int(match.group())
     
     raise ValueError(f"숫자를 추출할 수 없습니다: {text}")
 
 
+def extract_numbers(*texts):
+    """
+    여러 텍스트에서 각각 숫자 추출 (정규식 한 번으로 처리)
+    
+    extract_number를 필드마다 호출하는 대신, 입력을 구분자로 이어 붙여
+    한 번의 탐색으로 모든 필드의 첫 숫자를 추출합니다.
+    
+    Args:
+        *texts (str): "27일", "11시", "4시간", "5명" 등
+    
+    Returns:
+        tuple: 필드별 숫자 (입력 순서대로)
+    
+    Example:
+        >>> extract_numbers("27일", "11시", "4시간", "5명")
+        (27, 11, 4, 5)
+    
+    Raises:
+        ValueError: 숫자가 없는 필드가 있을 경우
+    """
+    if None in texts:
+        raise ValueError("입력값이 None입니다")
+    
+    joined = '\x00'.join(map(str, texts))
+    numbers = tuple(int(match.group(1)) for match in _FIELD_NUMBER_RE.finditer(joined))
+    
+    if len(numbers) != len(texts):
+        raise ValueError(f"숫자를 추출할 수 없습니다: {texts}")
+    
+    return numbers
+
+
 def parse_weekday(weekday_str):
     """
     요일 문자열을 요일 인덱스로 변환
@@ -84,7 +138,43 @@ def parse_weekday(weekday_str):
     raise ValueError(f"인식할 수 없는 요일: {weekday_str}")
 
 
-def parse_user_input(day, hour, minute=None):
+def resolve_schedule_datetime(day_num, hour_num, minute_num=0, today=None):
+    """
+    일(day)만 주어진 날짜를 실제 날짜로 변환
+    
+    오늘 이후(오늘 포함)의 일이면 이번 달, 이미 지난 일이면 다음 달로 계산합니다.
+    (12월 → 다음 해 1월 포함, 분기 없이 월 인덱스 연산으로 처리)
+    
+    Args:
+        day_num (int): 일 (1~31)
+        hour_num (int): 시 (0~23)
+        minute_num (int): 분 (0~59, 기본 0)
+        today (datetime, optional): 기준 시각 (기본: 현재 시각)
+    
+    Returns:
+        datetime: 계산된 날짜/시간
+    
+    Example:
+        >>> resolve_schedule_datetime(3, 11, today=datetime(2025, 12, 27))
+        datetime(2026, 1, 3, 11, 0)
+    
+    Raises:
+        ValueError: 해당 월에 없는 날짜 (예: 2월 30일)
+    """
+    if today is None:
+        today = datetime.now()
+    
+    # 0부터 시작하는 월 인덱스 (12 = 다음 해 1월)
+    month_index = today.month - 1 + (today.day > day_num)
+    
+    return datetime(
+        today.year + month_index // 12,
+        month_index % 12 + 1,
+        day_num, hour_num, minute_num
+    )
+
+
+def parse_user_input(day, hour, minute=None, today=None):
     """
     사용자 입력 날짜/시간 파싱 (범위 검색용)
     
@@ -94,6 +184,7 @@ def parse_user_input(day, hour, minute=None):
         day (str): 날짜 (예: "3일", "27일", "3", "27")
         hour (str): 시간 (예: "11시", "9시", "11", "9")
         minute (str, optional): 분 (예: "30분", "0분", "30", "0")
+        today (date, optional): 기준 날짜 (기본: 현재 시각)
     
     Returns:
         tuple: (start_datetime, end_datetime)
@@ -113,10 +204,8 @@ def parse_user_input(day, hour, minute=None):
         ValueError: 날짜/시간 형식이 잘못된 경우
     """
     try:
-        # 1. 숫자 추출 (한글 제거)
-        day_num = extract_number(day)
-        hour_num = extract_number(hour)
-        minute_num = extract_number(minute) if minute else 0
+        # 1. 숫자 추출 (한글 제거, 분 생략 시 0)
+        day_num, hour_num, minute_num = extract_numbers(day, hour, minute or '0')
         
         # 2. 유효성 검사
         if not (1 <= day_num <= 31):
@@ -126,18 +215,8 @@ def parse_user_input(day, hour, minute=None):
         if not (0 <= minute_num <= 59):
             raise ValueError(f"잘못된 분: {minute_num}분")
         
-        # 3. 오늘 기준 날짜 계산
-        today = datetime.now()
-        
-        # 오늘 날짜보다 작거나 같으면 이번 달, 크면 다음 달
-        if today.day <= day_num:
-            target_date = datetime(today.year, today.month, day_num, hour_num, minute_num, 0)
-        else:
-            # 다음 달
-            if today.month == 12:
-                target_date = datetime(today.year + 1, 1, day_num, hour_num, minute_num, 0)
-            else:
-                target_date = datetime(today.year, today.month + 1, day_num, hour_num, minute_num, 0)
+        # 3. 오늘 기준 날짜 계산 (지난 일이면 다음 달)
+        target_date = resolve_schedule_datetime(day_num, hour_num, minute_num, today)
         
         # 4. 범위 반환 (1시간 범위: 9시 0분 0초 ~ 9시 59분 59초)
         start_dt = target_date
@@ -149,7 +228,33 @@ def parse_user_input(day, hour, minute=None):
         raise ValueError(f"날짜 파싱 실패: {str(e)}")
 
 
-def parse_admin_schedule(day, hour, minute, duration, capacity):
+@lru_cache(maxsize=1024)
+def _parse_user_input_on(day, hour, minute, today):
+    """parse_user_input 결과 캐시 (기준 날짜별)"""
+    return parse_user_input(day, hour, minute, today=today)
+
+
+def parse_user_input_cached(day, hour, minute=None):
+    """
+    사용자 입력 날짜/시간 파싱 (캐시 사용)
+    
+    입력 종류가 적으므로("27일" × "11시") 같은 날 같은 입력은
+    다시 파싱하지 않습니다. 결과가 오늘 날짜에 따라 달라지므로
+    (다음 달 처리) 날짜를 캐시 키에 포함합니다.
+    
+    Args:
+        parse_user_input과 동일
+    
+    Returns:
+        tuple: (start_datetime, end_datetime)
+    
+    Raises:
+        ValueError: 파싱 실패 (실패 결과는 캐시하지 않음)
+    """
+    return _parse_user_input_on(day, hour, minute, date.today())
+
+
+def parse_admin_schedule(day, hour, minute, duration, capacity, today=None):
     """
     관리자가 입력한 스케줄 파싱
     
@@ -159,6 +264,7 @@ def parse_admin_schedule(day, hour, minute, duration, capacity):
         minute (str): "0분" 또는 "0"
         duration (str): "4시간" 또는 "4"
         capacity (str): "4명" 또는 "4"
+        today (date, optional): 기준 날짜 (기본: 현재 시각)
     
     Returns:
         dict: {
@@ -176,22 +282,13 @@ def parse_admin_schedule(day, hour, minute, duration, capacity):
         }
     """
     try:
-        # 숫자 추출 (한글 제거)
-        day_num = extract_number(day)
-        hour_num = extract_number(hour)
-        minute_num = extract_number(minute) if minute else 0
-        duration_hours = extract_number(duration)
-        capacity_num = extract_number(capacity)
+        # 숫자 추출 (한글 제거, 분 생략 시 0)
+        day_num, hour_num, minute_num, duration_hours, capacity_num = extract_numbers(
+            day, hour, minute or '0', duration, capacity
+        )
         
-        # 날짜 계산
-        today = datetime.now()
-        if today.day <= day_num:
-            schedule_dt = datetime(today.year, today.month, day_num, hour_num, minute_num, 0)
-        else:
-            if today.month == 12:
-                schedule_dt = datetime(today.year + 1, 1, day_num, hour_num, minute_num, 0)
-            else:
-                schedule_dt = datetime(today.year, today.month + 1, day_num, hour_num, minute_num, 0)
+        # 날짜 계산 (지난 일이면 다음 달)
+        schedule_dt = resolve_schedule_datetime(day_num, hour_num, minute_num, today)
         
         return {
             'schedule_datetime': schedule_dt,
@@ -202,6 +299,32 @@ def parse_admin_schedule(day, hour, minute, duration, capacity):
         raise ValueError(f"스케줄 파싱 실패: {str(e)}")
 
 
+@lru_cache(maxsize=2048)
+def _parse_admin_schedule_on(day, hour, minute, duration, capacity, today):
+    """parse_admin_schedule 결과 캐시 (기준 날짜별)"""
+    return parse_admin_schedule(day, hour, minute, duration, capacity, today=today)
+
+
+def parse_admin_schedule_cached(day, hour, minute, duration, capacity):
+    """
+    관리자 스케줄 파싱 (캐시 사용)
+    
+    같은 날 같은 입력(예: "27일", "11시", "0", "4시간", "5명")은
+    다시 파싱하지 않고 캐시된 결과를 반환합니다.
+    결과가 오늘 날짜에 따라 달라지므로(다음 달 처리) 날짜를 캐시 키에 포함합니다.
+    
+    Args:
+        parse_admin_schedule과 동일
+    
+    Returns:
+        dict: parse_admin_schedule과 동일 (호출마다 새 dict)
+    
+    Raises:
+        ValueError: 파싱 실패 (실패 결과는 캐시하지 않음)
+    """
+    return dict(_parse_admin_schedule_on(day, hour, minute, duration, capacity, date.today()))
+
+
 def format_datetime_short(dt):
     """
     날짜/시간을 짧은 형식으로 포맷
@@ -210,9 +333,7 @@ def format_datetime_short(dt):
         >>> format_datetime_short(datetime(2025, 11, 27, 11, 0, 0))
         "11월 27일 (수) 11:00"
     """
-    weekdays = ['월', '화', '수', '목', '금', '토', '일']
-    weekday = weekdays[dt.weekday()]
-    return dt.strftime(f"%m월 %d일 ({weekday}) %H:%M")
+    return dt.strftime(_SHORT_FORMATS[dt.weekday()])
 
 
 def format_datetime_korean(dt):
@@ -223,9 +344,7 @@ def format_datetime_korean(dt):
         >>> format_datetime_korean(datetime(2025, 11, 27, 11, 0, 0))
         "2025년 11월 27일 (수) 11:00"
     """
-    weekdays = ['월', '화', '수', '목', '금', '토', '일']
-    weekday = weekdays[dt.weekday()]
-    return dt.strftime(f"%Y년 %m월 %d일 ({weekday}) %H:%M")
+    return dt.strftime(_KOREAN_FORMATS[dt.weekday()])
 
 
 def format_duration(minutes):
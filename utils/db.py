@@ -3,48 +3,129 @@ MySQL Connection Pool 관리
 
 이 모듈은 PythonAnywhere 환경에서 MySQL 연결 풀을 생성하고,
 연결 풀 부족 시 대기+재시도 로직을 제공합니다.
+라우트에서는 요청 범위 연결(get_db)을 사용하며,
+요청 종료 시 teardown에서 한 번에 반납됩니다.
+요청 밖(앱 시작 시 관리자 캐시 예열, 스크립트 등)에서는 db_conn()을 사용합니다.
 """
 
 import time
+import queue
+import random
+import logging
 import mysql.connector
+from contextlib import contextmanager
+from flask import g, current_app, has_app_context
 from mysql.connector import pooling
-from mysql.connector.errors import PoolError
+from mysql.connector.errors import PoolError, InterfaceError
 import os
 
 
-def create_connection_pool():
+# 이 시간(초) 이상 풀에서 쉬고 있던 연결만 꺼낼 때 ping으로 확인
+# (MySQL wait_timeout보다 충분히 짧게 유지)
+POOL_PING_IDLE_SECONDS = 30
+
+# 풀 생성은 요청 밖(앱 시작)에서 실행되므로 모듈 로거 사용
+log = logging.getLogger(__name__)
+
+
+class LazyPingConnectionPool(pooling.MySQLConnectionPool):
+    """
+    오래 쉰 연결만 ping하는 Connection Pool
+    
+    기본 MySQLConnectionPool은 연결을 꺼낼 때마다 is_connected()로
+    서버에 ping을 보냅니다. (전역 풀 잠금을 잡은 채로 왕복 1회)
+    방금 반납된 연결은 살아 있으므로 ping을 생략하고,
+    POOL_PING_IDLE_SECONDS 이상 쉰 연결만 확인 후 재연결합니다.
+    
+    Note:
+        - 반납 시각은 add_connection()에서 연결 객체에 기록
+        - get_connection()은 mysql-connector 8.2 구현과 동일하고 ping 조건만 다름
+    """
+    
+    def add_connection(self, cnx=None):
+        """연결 반납 (반납 시각 기록)"""
+        if cnx is not None:
+            cnx._last_used = time.monotonic()
+        super().add_connection(cnx)
+    
+    def get_connection(self):
+        """연결 가져오기 (오래 쉰 연결만 ping)"""
+        with pooling.CONNECTION_POOL_LOCK:
+            try:
+                cnx = self._cnx_queue.get(block=False)
+            except queue.Empty as err:
+                raise PoolError("Failed getting connection; pool exhausted") from err
+            
+            idle = time.monotonic() - getattr(cnx, '_last_used', 0.0)
+            
+            if (
+                (idle >= POOL_PING_IDLE_SECONDS and not cnx.is_connected())
+                or self._config_version != cnx.pool_config_version
+            ):
+                cnx.config(**self._cnx_config)
+                try:
+                    cnx.reconnect()
+                except InterfaceError:
+                    # 재연결 실패, 연결을 풀에 되돌림
+                    self._queue_connection(cnx)
+                    raise
+                cnx.pool_config_version = self._config_version
+            
+            return pooling.PooledMySQLConnection(self, cnx)
+
+
+def create_connection_pool(pool_size=10, connection_timeout=5):
     """
     MySQL Connection Pool 생성
     
+    Args:
+        pool_size (int): 최대 동시 연결 수 (기본 10, 최대 32)
+        connection_timeout (int): 연결 타임아웃(초) (기본 5초)
+    
     Returns:
-        MySQLConnectionPool: mysql-connector-python 연결 풀 객체
+        LazyPingConnectionPool: 연결 풀 객체
     
     Raises:
         mysql.connector.Error: DB 연결 실패 시
     
     Note:
-        - pool_size=10: 최대 10개 동시 연결 허용
-        - pool_reset_session=True: 연결 재사용 시 세션 초기화
+        - pool_size: config.DB_POOL_SIZE 값 사용
+          (min(DB_POOL_SIZE 또는 기본값, 32), 기본값은 gthread: GUNICORN_THREADS 또는 4,
+          gevent: DB_MAX_CONNECTIONS ÷ 워커 수)
+        - pool_reset_session=False: 반납 시 COM_RESET_CONNECTION 왕복 생략
+          (세션 변수를 쓰지 않고, 미완료 트랜잭션은 close_db()가 롤백)
         - autocommit=False: 트랜잭션 명시적 제어
+        - DB_USE_PURE=true: 순수 파이썬 드라이버 사용 (gevent 워커 필수)
+        - 기본값은 C 확장 드라이버 (행 디코딩이 순수 파이썬보다 빠름)
+        - 서버 측 prepared statement는 사용하지 않음
+          (커서를 요청마다 새로 만들어 문장 재사용 이점이 적음)
     """
+    use_pure = os.environ.get('DB_USE_PURE', 'false').lower() == 'true'
+    
+    # C 확장이 없으면 커넥터가 조용히 순수 파이썬으로 동작하므로 알림
+    if not use_pure and not mysql.connector.HAVE_CEXT:
+        log.warning("⚠️ MySQL C 확장을 찾을 수 없어 순수 파이썬 드라이버로 동작합니다.")
+    
     try:
-        pool = pooling.MySQLConnectionPool(
+        pool = LazyPingConnectionPool(
             pool_name="schedule_pool",
-            pool_size=3,  # 3명 동시 접속 대응
-            pool_reset_session=True,
+            pool_size=pool_size,
+            pool_reset_session=False,
             host=os.environ.get('DB_HOST', 'localhost'),
             port=int(os.environ.get('DB_PORT', 3306)),
             user=os.environ.get('DB_USER', 'root'),
             password=os.environ.get('DB_PASSWORD', ''),
             database=os.environ.get('DB_NAME', 'scheduledb'),
+            connection_timeout=connection_timeout,
             autocommit=False,  # 트랜잭션 수동 제어
             get_warnings=True,
             charset='utf8mb4',
-            collation='utf8mb4_unicode_ci'
+            collation='utf8mb4_unicode_ci',
+            use_pure=use_pure
         )
         return pool
     except mysql.connector.Error as err:
-        print(f"❌ MySQL Connection Pool 생성 실패: {err}")
+        log.error("❌ MySQL Connection Pool 생성 실패: %s", err)
         raise
 
 
@@ -52,13 +133,24 @@ def create_connection_pool():
 connection_pool = None
 
 
-def get_db_connection(max_retries=3, retry_delay=0.1):
+def _pool_in_use():
+    """
+    현재 사용 중인 연결 수 (모니터링용)
+    
+    Returns:
+        int: pool_size - 대기 중인 연결 수
+    """
+    return connection_pool.pool_size - connection_pool._cnx_queue.qsize()
+
+
+def get_db_connection(max_retries=4, base_delay=0.025, max_delay=0.2):
     """
     Connection Pool에서 연결 가져오기 (대기+재시도 로직)
     
     Args:
-        max_retries (int): 최대 재시도 횟수 (기본 3회)
-        retry_delay (float): 재시도 대기 시간(초) (기본 0.1초)
+        max_retries (int): 최대 시도 횟수 (기본 4회)
+        base_delay (float): 첫 재시도 대기 시간(초) 및 지터 범위 (기본 0.025초)
+        max_delay (float): 재시도 대기 시간 상한(초) (기본 0.2초)
     
     Returns:
         mysql.connector.connection.MySQLConnection: DB 연결 객체
@@ -69,13 +161,14 @@ def get_db_connection(max_retries=3, retry_delay=0.1):
     Example:
         >>> conn = get_db_connection()
         >>> cursor = conn.cursor()
-        >>> cursor.execute("SELECT * FROM schedules")
-        >>> conn.close()
+        >>> cursor.execute("SELECT id, schedule_datetime FROM schedules")
+        >>> conn.close()  # 반납 누락 방지를 위해 db_conn() 사용 권장
     
     Note:
-        - 연결 풀이 꽉 찼을 때 대기 후 재시도
-        - 최대 0.3초(0.1초 × 3회) 대기
-        - 이후 PoolError 발생
+        - 연결 풀이 꽉 찼을 때 지수 백오프 + 지터로 대기 후 재시도
+          (0.025초, 0.05초, 0.1초 + 각각 0~0.025초 지터, 대기 중인 요청들이 동시에 깨어나지 않도록 분산)
+        - 총 0.175~0.25초 대기 후에도 부족하면 PoolError 발생 (짧은 신청 몰림은 대기열처럼 흡수)
+        - 풀 부족 시 사용 중인 연결 수를 경고 로그로 기록 (DB_POOL_SIZE 조정 근거)
     """
     if connection_pool is None:
         raise RuntimeError("Connection pool not initialized. Call create_connection_pool() first.")
@@ -84,12 +177,119 @@ def get_db_connection(max_retries=3, retry_delay=0.1):
         try:
             return connection_pool.get_connection()
         except PoolError as e:
+            in_use = _pool_in_use()
+            
+            if has_app_context():
+                current_app.logger.warning(
+                    "Connection pool exhausted (attempt %s/%s, in use %s/%s)",
+                    attempt + 1, max_retries, in_use, connection_pool.pool_size
+                )
+            
             if attempt < max_retries - 1:
-                # 연결 풀 부족, 대기 후 재시도
-                time.sleep(retry_delay)
+                # 연결 풀 부족, 대기 후 재시도 (지수 백오프 + 지터)
+                delay = base_delay * (2 ** attempt) + random.uniform(0, base_delay)
+                time.sleep(min(delay, max_delay))
             else:
                 # 최대 재시도 횟수 초과
                 raise PoolError(
-                    f"Connection pool exhausted after {max_retries} retries. "
+                    f"Connection pool exhausted after {max_retries} retries "
+                    f"(in use {in_use}/{connection_pool.pool_size}). "
                     f"Error: {str(e)}"
                 )
+
+
+@contextmanager
+def db_conn():
+    """
+    요청 범위 밖에서 사용하는 DB 연결 (with 블록 종료 시 반드시 반납)
+    
+    블록이 정상 종료되면 커밋, 예외가 발생하면 롤백한 뒤
+    연결을 풀에 반납합니다. (close() 누락으로 인한 풀 고갈 방지)
+    
+    Yields:
+        mysql.connector.connection.MySQLConnection: DB 연결 객체
+    
+    Example:
+        >>> with db_conn() as conn:
+        ...     cursor = conn.cursor()
+        ...     cursor.execute("DELETE FROM schedules WHERE schedule_datetime < NOW()")
+        ...     cursor.close()
+    
+    Note:
+        라우트에서는 get_db()를 사용 (teardown에서 자동 반납)
+    """
+    conn = get_db_connection()
+    
+    try:
+        yield conn
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+def get_db():
+    """
+    요청 범위 DB 연결 가져오기
+    
+    요청 중 처음 호출될 때만 Connection Pool에서 연결을 가져오고,
+    이후 호출은 같은 연결을 재사용합니다.
+    연결 반납은 close_db()가 요청 종료 시 처리합니다.
+    
+    Returns:
+        mysql.connector.connection.MySQLConnection: DB 연결 객체
+    
+    Example:
+        >>> conn = get_db()
+        >>> cursor = conn.cursor(dictionary=True)
+        >>> cursor.execute("SELECT id, schedule_datetime FROM schedules")
+        >>> cursor.close()
+    """
+    if 'db' not in g:
+        g.db = get_db_connection()
+    return g.db
+
+
+def get_cursor(dictionary=False):
+    """
+    요청 범위 연결에서 커서 생성
+    
+    생성한 커서는 요청 종료 시 close_db()가 함께 닫으므로
+    핸들러에서 try/finally로 직접 닫을 필요가 없습니다.
+    
+    Args:
+        dictionary (bool): 결과를 dict로 받을지 여부 (기본 False)
+    
+    Returns:
+        MySQLCursor: 커서 객체
+    
+    Example:
+        >>> cursor = get_cursor(dictionary=True)
+        >>> cursor.execute("SELECT id FROM schedules")
+    """
+    cursor = get_db().cursor(dictionary=dictionary)
+    g.setdefault('db_cursors', []).append(cursor)
+    return cursor
+
+
+def close_db(e=None):
+    """
+    요청 범위 DB 연결 반납 (teardown_appcontext 핸들러)
+    
+    get_cursor()로 만든 커서를 닫고,
+    커밋되지 않은 트랜잭션은 롤백한 뒤 연결을 풀에 반납합니다.
+    
+    Args:
+        e (Exception, optional): 요청 처리 중 발생한 예외
+    """
+    for cursor in g.pop('db_cursors', ()):
+        cursor.close()
+    
+    conn = g.pop('db', None)
+    
+    if conn is not None:
+        if conn.in_transaction:
+            conn.rollback()
+        conn.close()
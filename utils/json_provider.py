@@ -0,0 +1,95 @@
+"""
+orjson 기반 Flask JSON Provider
+
+Flask 기본 JSON 인코더(순수 파이썬 json) 대신 orjson(C 구현)을 사용하여
+카카오톡 응답(한글 포함) 직렬화 및 웹훅 요청 본문 파싱 비용을 줄입니다.
+
+orjson을 설치할 수 없는 환경(PyPy 등)에서는 ujson, 둘 다 없으면
+Flask 기본 Provider를 사용합니다. (FastJSONProvider가 자동 선택)
+"""
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # orjson 휠이 없는 환경 (PyPy 등)
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    orjson으로 직렬화하는 JSON Provider
+    
+    Example:
+        >>> app.json = OrjsonProvider(app)
+        >>> # 라우트에서 dict 반환 시 orjson으로 직렬화됨
+        >>> # request.json / request.get_json()도 orjson으로 파싱됨
+    
+    Note:
+        - 한글은 \\uXXXX 이스케이프 없이 UTF-8 그대로 출력
+        - orjson이 처리하지 못하는 타입은 Flask 기본 변환(default)으로 위임
+    """
+    
+    def dumps(self, obj, **kwargs):
+        """객체를 JSON 문자열로 직렬화"""
+        return orjson.dumps(
+            obj,
+            default=self.default,
+            option=orjson.OPT_NON_STR_KEYS
+        ).decode('utf-8')
+    
+    def response(self, *args, **kwargs):
+        """
+        라우트 반환값(dict)을 JSON 응답으로 변환
+        
+        orjson 결과(bytes)를 그대로 응답 본문으로 사용하여
+        dumps()의 문자열 디코딩 → 응답 시 재인코딩 과정을 생략합니다.
+        (디버그 모드의 들여쓰기 출력은 지원하지 않음)
+        """
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS),
+            mimetype=self.mimetype
+        )
+    
+    def loads(self, s, **kwargs):
+        """
+        JSON 문자열/바이트를 파싱
+        
+        request.get_json()은 요청 본문을 bytes로 전달하므로
+        유니코드 디코딩 없이 바로 파싱합니다.
+        """
+        return orjson.loads(s)
+
+
+class UJSONProvider(DefaultJSONProvider):
+    """
+    ujson으로 직렬화하는 JSON Provider (orjson 대체용)
+    
+    Note:
+        ujson은 사용자 정의 변환(default)을 거치지 않으므로
+        응답에는 datetime 등을 넣지 말고 미리 문자열로 포맷해야 합니다.
+        (format_datetime_short / format_datetime_korean 사용)
+    """
+    
+    def dumps(self, obj, **kwargs):
+        """객체를 JSON 문자열로 직렬화"""
+        return ujson.dumps(obj, ensure_ascii=False)
+    
+    def loads(self, s, **kwargs):
+        """JSON 문자열/바이트를 파싱"""
+        return ujson.loads(s)
+
+
+# 설치된 라이브러리 중 가장 빠른 Provider 선택
+if orjson is not None:
+    FastJSONProvider = OrjsonProvider
+elif ujson is not None:
+    FastJSONProvider = UJSONProvider
+else:
+    FastJSONProvider = DefaultJSONProvider
@@ -0,0 +1,66 @@
+"""
+카카오톡 스킬 요청 파싱 함수
+
+이 모듈은 카카오톡 스킬 요청 JSON에서 자주 쓰는 값을
+한 번에 꺼내는 헬퍼를 제공합니다.
+"""
+
+# 스케줄 엔티티 파라미터 이름
+# 예) "27일 월요일 11시 4시간 5명"
+SCHEDULE_PARAMS = ('date_day', 'week_day', 'time_hour', 'duration_hour', 'capacity_count')
+
+# 정원 없는 스케줄 파라미터 (신청/삭제용)
+# 예) "27일 월요일 11시 4시간"
+SCHEDULE_KEY_PARAMS = SCHEDULE_PARAMS[:4]
+
+
+def extract_params(data, names):
+    """
+    user_id와 엔티티 파라미터를 한 번에 추출
+    
+    Args:
+        data (dict): 카카오톡 스킬 요청 JSON
+        names (tuple): 추출할 파라미터 이름 (예: SCHEDULE_PARAMS)
+    
+    Returns:
+        tuple: (user_id, (파라미터 값, ...))
+            - 없는 값은 None (잘못된 요청도 KeyError 없이 처리)
+    
+    Example:
+        >>> user_id, (day, week_day, hour, duration) = extract_params(
+        ...     data, SCHEDULE_KEY_PARAMS
+        ... )
+    """
+    params = (data.get('action') or {}).get('params') or {}
+    return extract_user_id(data), tuple(map(params.get, names))
+
+
+def extract_user_id(data):
+    """
+    user_id 추출 (없으면 None)
+    
+    Args:
+        data (dict): 카카오톡 스킬 요청 JSON
+    
+    Returns:
+        str: 카카오톡 user_id (없으면 None)
+    """
+    return ((data.get('userRequest') or {}).get('user') or {}).get('id')
+
+
+def extract_utterance(data):
+    """
+    user_id와 발화를 한 번에 추출
+    
+    Args:
+        data (dict): 카카오톡 스킬 요청 JSON
+    
+    Returns:
+        tuple: (user_id, utterance)
+            - 없는 값은 None
+    
+    Example:
+        >>> user_id, utterance = extract_utterance(data)
+    """
+    user_request = data.get('userRequest') or {}
+    return (user_request.get('user') or {}).get('id'), user_request.get('utterance')
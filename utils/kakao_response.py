@@ -3,15 +3,67 @@
 
 이 모듈은 카카오톡 스킬 응답의 반복적인 JSON 구조를 
 템플릿 함수로 추상화하여 코드 중복을 제거합니다. (DRY 원칙)
+
+고정 응답/캐시 응답은 serialize()로 한 번만 직렬화해 두고
+json_response()로 반환하여 요청마다 다시 직렬화하지 않습니다.
+라우트 공통 예외 처리(handle_errors)도 실패 응답을 만들기 위해 이 모듈에 둡니다.
 """
 
+import json
+from functools import wraps
+from flask import current_app
+
+try:
+    import orjson
+except ImportError:  # orjson 휠이 없는 환경 (PyPy 등)
+    orjson = None
+
+
+def serialize(response):
+    """
+    응답 dict를 JSON bytes로 미리 직렬화
+    
+    Args:
+        response (dict): 카카오톡 응답 (simple_text, list_card 등)
+    
+    Returns:
+        bytes: UTF-8 JSON (한글 이스케이프 없음)
+    
+    Example:
+        >>> HELP_BODY = serialize(simple_text("도움말"))  # 모듈 로드 시 1회
+    
+    Note:
+        orjson이 설치되어 있으면 orjson, 없으면 표준 json 사용
+    """
+    if orjson is not None:
+        return orjson.dumps(response)
+    
+    return json.dumps(response, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
 
-def simple_text(text):
+def json_response(body):
+    """
+    미리 직렬화한 JSON으로 응답 생성 (직렬화 생략)
+    
+    Args:
+        body (bytes): serialize() 결과
+    
+    Returns:
+        Response: application/json 응답
+    
+    Example:
+        >>> return json_response(HELP_BODY)
+    """
+    return current_app.response_class(body, mimetype='application/json')
+
+
+def simple_text(text, data=None):
     """
     단순 텍스트 응답 생성
     
     Args:
         text (str): 사용자에게 표시할 텍스트
+        data (dict, optional): 스킬 데이터 (사용자에게 표시되지 않음, 기계 판독용)
     
     Returns:
         dict: 카카오톡 API 2.0 형식의 JSON 응답
@@ -27,7 +79,7 @@ def simple_text(text):
             }
         }
     """
-    return {
+    response = {
         "version": "2.0",
         "template": {
             "outputs": [{
@@ -37,6 +89,11 @@ def simple_text(text):
             }]
         }
     }
+    
+    if data is not None:
+        response["data"] = data
+    
+    return response
 
 
 def list_card(header_title, items, buttons):
@@ -100,6 +157,28 @@ def list_card(header_title, items, buttons):
     }
 
 
+def list_card_from_rows(header_title, rows, item_fn, buttons):
+    """
+    DB 조회 결과로 ListCard 응답 생성
+    
+    아이템 리스트를 호출부에서 append로 만들지 않고
+    행마다 item_fn을 적용해 한 번에 생성합니다.
+    
+    Args:
+        header_title (str): 카드 헤더 제목
+        rows (iterable): DB 조회 결과 행
+        item_fn (callable): 행 → 아이템 dict 변환 함수
+        buttons (list): 하단 버튼 리스트 (list_card와 동일)
+    
+    Returns:
+        dict: 카카오톡 ListCard 응답
+    
+    Example:
+        >>> list_card_from_rows("📅 스케줄 현황", cursor.fetchall(), schedule_item, [])
+    """
+    return list_card(header_title, [item_fn(row) for row in rows], buttons)
+
+
 def simple_text_with_quick_replies(text, quick_replies):
     """
     텍스트 + 퀵리플라이 응답 생성
@@ -164,3 +243,41 @@ def context_response(text, context_name, lifespan, params):
             }]
         }
     }
+
+
+def handle_errors(action, message=None):
+    """
+    라우트 핸들러 공통 예외 처리 데코레이터 (사용자/관리자 라우트 공통)
+    
+    Args:
+        action (str): 로그/실패 메시지에 쓸 작업 이름 (예: "스케줄 등록")
+        message (str, optional): 실패 응답 문구 (기본값: "❌ {action}에 실패했습니다.")
+    
+    Example:
+        >>> @bp.route('/admin/register', methods=['POST'])
+        ... @handle_errors('스케줄 등록')
+        ... def register_schedule(): ...
+    
+    Note:
+        - ValueError: 입력 형식 오류 응답
+        - 그 외 예외: 실패 응답
+        - 커서/연결 정리는 요청 종료 시 close_db()가 처리 (get_cursor() 사용)
+    """
+    failure_message = message or f"❌ {action}에 실패했습니다."
+    
+    def decorator(handler):
+        @wraps(handler)
+        def wrapper(*args, **kwargs):
+            try:
+                return handler(*args, **kwargs)
+            
+            except ValueError as e:
+                current_app.logger.warning("파라미터 파싱 에러: %s", e)
+                return simple_text(f"❌ 입력 형식이 올바르지 않습니다.\n{str(e)}")
+            
+            except Exception as e:
+                current_app.logger.error("❌ %s 실패: %s", action, e, exc_info=True)
+                return simple_text(failure_message)
+        
+        return wrapper
+    return decorator
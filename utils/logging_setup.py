@@ -6,8 +6,187 @@
 """
 
 import os
+import json
+import queue
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+
+
+# 로그 디렉토리 (PythonAnywhere 등에서는 절대 경로 지정 가능)
+LOG_DIR = os.environ.get('LOG_DIR', 'logs')
+
+# 에러 로그 파일 (웹 에러 대시보드도 이 파일을 읽음)
+ERROR_LOG_FILE = os.path.join(LOG_DIR, 'error.log')
+
+# 감사 로그 (API 호출/관리자 액션, setup_logging에서 앱 로그와 같은 파일로 연결)
+audit_log = logging.getLogger('schedule_bot.audit')
+
+# 로그 파일에 한 번에 쓰는 최대 레코드 수
+LOG_BATCH_SIZE = 64
+
+# 프로세스 공용 QueueHandler (setup_logging 첫 호출 시 생성, 리스너 스레드도 하나만 실행)
+_queue_handler = None
+
+# 로그 파일 쓰기 버퍼 크기 (bytes, 묶음 하나가 한 번의 write 시스템 콜로 처리되도록)
+LOG_BUFFER_SIZE = 64 * 1024
+
+
+class BatchingFileHandler(RotatingFileHandler):
+    """
+    로그를 모아서 한 번에 쓰는 RotatingFileHandler
+    
+    레코드마다 write()하지 않고 버퍼에 쌓아 두었다가
+    LOG_BATCH_SIZE개가 모이거나 flush() 호출 시 한 번에 기록합니다.
+    
+    Note:
+        - BatchingQueueListener와 함께 사용 (대기열이 비면 flush)
+        - 로테이션 여부는 묶음 단위로 판단
+        - 파일은 LOG_BUFFER_SIZE 버퍼로 열고 flush()에서만 디스크로 내보냄
+    """
+    
+    def __init__(self, *args, batch_size=LOG_BATCH_SIZE, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.batch_size = batch_size
+        self._buffer = []
+    
+    def _open(self):
+        """큰 쓰기 버퍼로 로그 파일 열기"""
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=LOG_BUFFER_SIZE,
+            encoding=self.encoding
+        )
+    
+    def emit(self, record):
+        """레코드를 버퍼에 추가 (가득 차면 기록)"""
+        try:
+            self._buffer.append(self.format(record) + self.terminator)
+            
+            if len(self._buffer) >= self.batch_size:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+    
+    def flush(self):
+        """버퍼에 쌓인 로그를 한 번의 write()로 기록"""
+        self.acquire()
+        try:
+            if self._buffer:
+                data = ''.join(self._buffer)
+                self._buffer.clear()
+                
+                if self.stream is None:
+                    self.stream = self._open()
+                
+                if self.maxBytes > 0 and self.stream.tell() + len(data) >= self.maxBytes:
+                    self.doRollover()
+                
+                self.stream.write(data)
+            
+            super().flush()
+        finally:
+            self.release()
+    
+    def close(self):
+        """남은 로그 기록 후 파일 닫기"""
+        self.flush()
+        super().close()
+
+
+class BatchingQueueListener(QueueListener):
+    """
+    대기열이 비었을 때 핸들러를 flush하는 QueueListener
+    
+    요청이 몰리면 쌓인 로그를 묶어서 기록하고,
+    한가할 때는 대기 없이 바로 기록합니다. (별도 타이머 불필요)
+    """
+    
+    def dequeue(self, block):
+        """다음 레코드를 기다리기 전에 버퍼 비우기"""
+        if block and self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+        
+        return self.queue.get(block)
+
+
+class JsonLineFormatter(logging.Formatter):
+    """
+    로그 레코드를 JSON 한 줄로 포맷 (JSONL)
+    
+    level 키를 항상 맨 앞에 두므로 에러 라인은
+    b'{"level":"ERROR"' 접두사만으로 걸러낼 수 있습니다.
+    (메시지에 'ERROR'가 포함된 INFO 로그 오탐 방지)
+    
+    Example:
+        {"level":"ERROR","time":"2025-11-27 11:00:00","logger":"app","message":"..."}
+    """
+    
+    def format(self, record):
+        """로그 레코드를 JSON 문자열로 변환"""
+        entry = {
+            'level': record.levelname,
+            'time': self.formatTime(record, self.datefmt),
+            'logger': record.name,
+            'message': record.getMessage()
+        }
+        
+        # 트레이스백도 한 줄에 포함 (여러 줄로 나뉘지 않도록)
+        if record.exc_info:
+            entry['exc_info'] = self.formatException(record.exc_info)
+        
+        return json.dumps(entry, ensure_ascii=False, separators=(',', ':'))
+
+
+def _start_queue_logging(log_level):
+    """
+    로그 파일 핸들러/리스너 스레드 시작 (프로세스당 한 번)
+    
+    Args:
+        log_level (int): 로그 레벨
+    
+    Returns:
+        QueueHandler: 앱 로거에 연결할 핸들러
+    """
+    # RotatingFileHandler 설정 (묶음 단위로 기록)
+    # 10MB 초과 시 자동으로 error.log.1, error.log.2... 생성
+    file_handler = BatchingFileHandler(
+        ERROR_LOG_FILE,
+        maxBytes=10 * 1024 * 1024,  # 10MB
+        backupCount=5,              # 최대 5개 백업 파일
+        encoding='utf-8'
+    )
+    
+    # QueueHandler가 이미 JSON으로 포맷한 메시지를 그대로 기록
+    file_handler.setFormatter(logging.Formatter('%(message)s'))
+    
+    # 요청 스레드는 포맷 후 대기열에 넣기만 하고, 디스크 쓰기는 리스너 스레드가 처리
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    
+    # 로그 포맷 설정 (한 줄에 JSON 하나)
+    queue_handler.setFormatter(JsonLineFormatter(datefmt='%Y-%m-%d %H:%M:%S'))
+    queue_handler.setLevel(log_level)
+    
+    listener = BatchingQueueListener(log_queue, file_handler)
+    listener.start()
+    
+    # 종료 시 대기열에 남은 로그 기록
+    atexit.register(listener.stop)
+    
+    # 감사 로거 + 모듈 로거에 핸들러 추가
+    audit_log.addHandler(queue_handler)
+    audit_log.setLevel(log_level)
+    audit_log.propagate = False
+    
+    # 요청 밖에서 쓰는 모듈 로거 (utils.db 등, logging.getLogger(__name__))
+    utils_log = logging.getLogger('utils')
+    utils_log.addHandler(queue_handler)
+    utils_log.setLevel(log_level)
+    
+    return queue_handler
 
 
 def setup_logging(app):
@@ -21,8 +200,13 @@ def setup_logging(app):
         - 개발 환경 (FLASK_ENV=development): DEBUG 레벨
         - 프로덕션 환경 (그 외): INFO 레벨
         - 로그 로테이션: 10MB × 5개 백업
-        - 에러 로그: logs/error.log
+        - 에러 로그: LOG_DIR/error.log (기본 logs/error.log, JSON Lines 형식)
+        - 파일 쓰기는 QueueListener 스레드가 담당 (요청 스레드는 대기열에 넣고 반환)
+        - 대기열이 빌 때까지 모은 로그를 한 번에 기록 (최대 LOG_BATCH_SIZE개)
         - 감사 로그: INFO 레벨 (신청/취소 기록)
+        - 관리자 액션 로그: 감사 로그와 같은 대기열로 기록 (종료 시 listener.stop에서 기록)
+        - 여러 번 호출해도 (테스트, 앱 팩토리 재실행) 핸들러/리스너는 한 번만 생성하고
+          새 앱 로거에 같은 핸들러만 연결 (감사 로그 중복 기록 방지)
     
     Example:
         >>> from flask import Flask
@@ -30,9 +214,11 @@ def setup_logging(app):
         >>> setup_logging(app)
         >>> app.logger.info("User 123 applied")  # INFO 레벨 기록
     """
+    global _queue_handler
+    
     # 로그 디렉토리 생성
-    if not os.path.exists('logs'):
-        os.mkdir('logs')
+    # (여러 워커가 동시에 시작해도 안전)
+    os.makedirs(LOG_DIR, exist_ok=True)
     
     # 환경 변수로 로그 레벨 자동 전환
     if os.environ.get('FLASK_ENV') == 'development':
@@ -42,70 +228,59 @@ def setup_logging(app):
         log_level = logging.INFO
         app.logger.info("🚀 Production mode: INFO logging enabled")
     
-    # RotatingFileHandler 설정
-    # 10MB 초과 시 자동으로 error.log.1, error.log.2... 생성
-    file_handler = RotatingFileHandler(
-        'logs/error.log',
-        maxBytes=10 * 1024 * 1024,  # 10MB
-        backupCount=5,              # 최대 5개 백업 파일
-        encoding='utf-8'
-    )
-    
-    # 로그 포맷 설정
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    file_handler.setFormatter(formatter)
-    file_handler.setLevel(log_level)
+    if _queue_handler is None:
+        _queue_handler = _start_queue_logging(log_level)
     
-    # Flask 앱 로거에 핸들러 추가
-    app.logger.addHandler(file_handler)
+    # Flask 앱 로거에 핸들러 추가 (감사/모듈 로거는 첫 호출 때 연결됨)
+    app.logger.addHandler(_queue_handler)
     app.logger.setLevel(log_level)
     
     # 시작 메시지
     app.logger.info('=' * 50)
     app.logger.info('Schedule Bot Starting')
     app.logger.info(f'Log level: {logging.getLevelName(log_level)}')
-    app.logger.info(f'Log file: logs/error.log')
+    app.logger.info(f'Log file: {ERROR_LOG_FILE}')
     app.logger.info('=' * 50)
 
 
-def log_api_call(app, endpoint, user_id, params=None):
+def log_api_call(endpoint, user_id, params=None):
     """
     API 호출 로그 기록 (감사 로그)
     
     Args:
-        app (Flask): Flask 앱 객체
         endpoint (str): API 엔드포인트 (예: "/apply")
         user_id (str): 사용자 ID
         params (dict, optional): 추가 파라미터
     
     Example:
-        >>> log_api_call(app, "/apply", "user123", {"schedule_id": 50})
+        >>> log_api_call("/apply", "user123", {"schedule_id": 50})
         # 로그: INFO - API Call: /apply | User: user123 | Params: {...}
     """
-    log_msg = f"API Call: {endpoint} | User: {user_id}"
+    # 지연 포맷: INFO가 꺼져 있으면 문자열을 만들지 않음
     if params:
-        log_msg += f" | Params: {params}"
-    app.logger.info(log_msg)
+        audit_log.info("API Call: %s | User: %s | Params: %s", endpoint, user_id, params)
+    else:
+        audit_log.info("API Call: %s | User: %s", endpoint, user_id)
 
 
-def log_admin_action(app, action, admin_id, details=None):
+def log_admin_action(action, admin_id, details=None):
     """
     관리자 액션 로그 기록
     
+    파일 쓰기는 QueueHandler 리스너 스레드가 처리하므로 요청 스레드를 막지 않으며,
+    종료 시 남은 로그도 listener.stop에서 기록됩니다.
+    
     Args:
-        app (Flask): Flask 앱 객체
         action (str): 액션 종류 (예: "DELETE_SCHEDULE")
         admin_id (str): 관리자 ID
         details (dict, optional): 상세 정보
     
     Example:
-        >>> log_admin_action(app, "DELETE_SCHEDULE", "admin123", {"schedule_id": 50})
+        >>> log_admin_action("DELETE_SCHEDULE", "admin123", {"schedule_id": 50})
         # 로그: INFO - Admin Action: DELETE_SCHEDULE | Admin: admin123 | Details: {...}
     """
-    log_msg = f"Admin Action: {action} | Admin: {admin_id}"
+    # 지연 포맷: INFO가 꺼져 있으면 문자열을 만들지 않음
     if details:
-        log_msg += f" | Details: {details}"
-    app.logger.info(log_msg)
+        audit_log.info("Admin Action: %s | Admin: %s | Details: %s", action, admin_id, details)
+    else:
+        audit_log.info("Admin Action: %s | Admin: %s", action, admin_id)
@@ -5,6 +5,15 @@
 비즈니스 로직 검증을 수행합니다.
 """
 
+from collections import namedtuple
+
+
+# 검증 결과 (튜플이므로 기존처럼 언패킹도 가능)
+ValidationResult = namedtuple('ValidationResult', 'ok error')
+
+# 검증 통과 결과 (모든 호출이 같은 객체 공유)
+_VALID = ValidationResult(True, None)
+
 
 def validate_capacity_change(current_count, new_capacity):
     """
@@ -17,23 +26,23 @@ def validate_capacity_change(current_count, new_capacity):
         new_capacity (int): 새로운 정원
     
     Returns:
-        tuple: (is_valid: bool, error_message: str or None)
+        ValidationResult: (ok: bool, error: str or None)
     
     Example:
         >>> validate_capacity_change(3, 5)
-        (True, None)
+        ValidationResult(ok=True, error=None)
         
-        >>> validate_capacity_change(3, 2)
-        (False, "현재 신청 인원(3명)보다 적게 설정할 수 없습니다.")
+        >>> validate_capacity_change(3, 2).error
+        "현재 신청 인원(3명)보다 적게 설정할 수 없습니다. ..."
     """
     if new_capacity < current_count:
-        return (
+        return ValidationResult(
             False,
             f"현재 신청 인원({current_count}명)보다 적게 설정할 수 없습니다. "
             f"최소 {current_count}명 이상으로 설정해주세요."
         )
     
-    return (True, None)
+    return _VALID
 
 
 def validate_datetime_range(start_dt, end_dt):
@@ -45,9 +54,9 @@ def validate_datetime_range(start_dt, end_dt):
         end_dt (datetime): 종료 시간
     
     Returns:
-        tuple: (is_valid: bool, error_message: str or None)
+        ValidationResult: (ok: bool, error: str or None)
     """
     if start_dt >= end_dt:
-        return (False, "시작 시간이 종료 시간보다 늦습니다.")
+        return ValidationResult(False, "시작 시간이 종료 시간보다 늦습니다.")
     
-    return (True, None)
+    return _VALID
@@ -7,6 +7,7 @@ PythonAnywhere WSGI 설정
 
 import sys
 import os
+from dotenv import load_dotenv
 
 # 프로젝트 경로 추가
 # PythonAnywhere: /home/yourusername/kakao-schedule-bot
@@ -14,15 +15,10 @@ path = '/home/yourusername/kakao-schedule-bot'
 if path not in sys.path:
     sys.path.insert(0, path)
 
-# 환경 변수 설정 (WSGI 파일에서 직접 설정하는 것이 더 안전)
-# .env 파일 대신 여기서 설정
-os.environ['DB_HOST'] = 'yourusername.mysql.pythonanywhere-services.com'
-os.environ['DB_PORT'] = '3306'
-os.environ['DB_USER'] = 'yourusername'
-os.environ['DB_PASSWORD'] = 'your_mysql_password'
-os.environ['DB_NAME'] = 'yourusername$scheduledb'
-os.environ['SECRET_KEY'] = 'your-secret-key-here'
-os.environ['FLASK_ENV'] = 'production'
+# 환경 변수 설정: 프로젝트 경로의 .env 파일에서 로드 (비밀값을 코드에 두지 않음)
+# 작업 디렉토리와 무관하게 절대 경로로 읽고, 이미 설정된 값은 덮어쓰지 않음
+load_dotenv(os.path.join(path, '.env'), override=False)
+os.environ.setdefault('FLASK_ENV', 'production')
 
 # Flask 앱 임포트
 from app import app as application